@@ -80,9 +80,62 @@ Typical usage and comparison with non-memoized generators:
     >>> tryit(g3)
     Stopping
     >>> tryit(g4)
+
+Optional counters can be collected for each memoized generator;
+they are off by default, and are switched on by setting the class
+field ``instrumented`` before the generator is realized:
+
+    >>> MemoizedGenerator.instrumented = True
+    >>> g5 = gen()
+    >>> g6 = gen()
+    >>> list(g5)
+    [0, 1]
+    >>> list(g6)
+    [0, 1]
+    >>> s = gen.stats()
+    >>> s['terms'], s['hits'], s['misses']
+    (2, 4, 0)
+    >>> MemoizedGenerator.instrumented = False
+
+Note that the terms were all computed above, before we switched
+on the counters, so every term yielded by both realizations here
+was a memo hit.
+
+By default every term is kept, but a memoized generator can be set
+to keep only a window of the most recent terms, for consumers that
+stream terms and never look back far; a realization that asks for a
+term that has been discarded gets an ``IndexError``:
+
+    >>> def naturals():
+    ...     for n in count():
+    ...         yield n
+    ...
+    >>> gen = MemoizedGenerator(naturals)
+    >>> gen.setwindow(2)
+    >>> g7 = gen()
+    >>> g8 = gen()
+    >>> list(islice(g7, 6))
+    [0, 1, 2, 3, 4, 5]
+    >>> gen.cached(), gen.stats()['terms']
+    ([3, 4, 5], 6)
+    >>> next(g8)
+    Traceback (most recent call last):
+    ...
+    IndexError: Term 0 of memoized generator has been discarded.
+
+Once a consumer that needs every term has pinned the generator to
+keep them, its window can't be set again:
+
+    >>> gen = MemoizedGenerator(naturals)
+    >>> gen.setwindow(None, pin=True)
+    >>> gen.setwindow(2)
+    Traceback (most recent call last):
+    ...
+    ValueError: Memoized generator must keep all its terms.
 """
 
-from itertools import count
+from itertools import count, islice
+from timeit import default_timer
 
 
 class MemoizedGenerator(object):
@@ -112,8 +165,33 @@ class MemoizedGenerator(object):
     handles this issue correctly; it can be found on PyPI at:
         
         http://pypi.python.org/pypi/plib
+    
+    Setting the class field ``instrumented`` to ``True`` makes each
+    realization created afterwards count memo hits and misses and
+    the time spent in the underlying generator itself; see the
+    ``stats`` method. Realizations created while it is ``False``
+    pay nothing for the counters.
+    
+    The class field ``tracer`` can also be set to an object with
+    ``hit``, ``push`` and ``pop`` methods, which instrumented
+    realizations call with this instance when they yield a cached
+    term, and just before and after they advance the underlying
+    generator; the ``SeriesTracer`` class in ``seriestrace.py``
+    uses this to record which generators pull terms from which.
+    
+    The ``window`` field is the number of most recent terms that are
+    kept in the cache, or ``None`` (the default) to keep all of them;
+    see the ``setwindow`` method.
     """
     
+    instrumented = False
+    tracer = None
+    window = None
+    
+    # The time spent in the underlying generators of other instances while
+    # each instrumented advance in progress is running, innermost last
+    _timing = []
+    
     def __init__(self, gen):
         # The underlying generator
         self.__gen = gen
@@ -121,20 +199,236 @@ class MemoizedGenerator(object):
         self.__cache = []
         self.__iter = None
         self.__empty = False
+        # Index of the first term in the cache, and whether the window
+        # may be changed from None
+        self.__offset = 0
+        self.__pinned = False
+        # Instrumentation fields
+        self.owner = None
+        self.hits = 0
+        self.misses = 0
+        self.elapsed = 0.0
     
     def __call__(self, *args, **kwargs):
         """Make instances of this class callable.
         
-        This method must be present, and must be a generator
-        function, so that class instances work the same as their
-        underlying generators.
+        This method must be present, and must return a generator,
+        so that class instances work the same as their underlying
+        generators.
         """
         if not (self.__empty or self.__iter):
             self.__iter = self.__gen(*args, **kwargs)
+        if self.instrumented:
+            return self._counted(self.__cache)
+        return self._memoized(self.__cache)
+    
+    def stats(self):
+        """Return a dict of the instrumentation counters.
+        
+        The keys are ``terms`` (the number of terms memoized so far),
+        ``hits`` and ``misses`` (the number of terms yielded from the
+        cache and from the underlying generator, respectively), and
+        ``time`` (the cumulative time, in seconds, spent advancing the
+        underlying generator, not counting the time it spends advancing
+        other instrumented generators, so that nested and re-entrant
+        advances are not counted twice). Only ``terms`` is counted when
+        the class field ``instrumented`` is ``False``.
+        """
+        return dict(terms=self.__offset + len(self.__cache), hits=self.hits,
+                    misses=self.misses, time=self.elapsed)
+    
+    def setwindow(self, window, pin=False):
+        """Keep only the last ``window`` terms, or all terms if ``window`` is ``None``.
+        
+        The cache is trimmed as terms are added, when it reaches twice the
+        window, so it holds at most that many terms; a window of zero keeps
+        no terms at all once the next one has been computed. Terms already
+        computed are kept until then, so a consumer can still start from
+        them after the window is set. If ``pin`` is true, the window must
+        be ``None``, and it can't be changed afterwards. A window can't
+        be removed once terms have been discarded, so a ``ValueError`` is
+        raised in either case.
+        """
+        if (window is not None) and (pin or self.__pinned):
+            raise ValueError("Memoized generator must keep all its terms.")
+        if (window is None) and self.__offset:
+            raise ValueError("Memoized generator has already discarded terms.")
+        self.window = window
+        self.__pinned = self.__pinned or pin
+    
+    @property
+    def discarded(self):
+        """The number of terms discarded so far; see ``setwindow``.
+        """
+        return self.__offset
+    
+    @property
+    def running(self):
+        """True while the underlying generator is computing a term.
+        
+        A realization made then is made by the underlying generator
+        itself, as in a recursive definition.
+        """
+        return bool(getattr(self.__iter, 'gi_running', False))
+    
+    def clear(self):
+        """Drop the memoized terms and the underlying generator.
+        
+        The next realization starts the underlying generator over. Since
+        the underlying generator's frame is dropped with it, this breaks
+        any reference cycles that run through it, for example between
+        recursively defined generators that each hold a realization of
+        the other's memoized generator. Realizations made before the
+        call can't be resumed afterwards; they raise ``ValueError``:
+        
+        >>> def naturals():
+        ...     for n in count():
+        ...         yield n
+        ...
+        >>> gen = MemoizedGenerator(naturals)
+        >>> g = gen()
+        >>> next(g), next(g)
+        (0, 1)
+        >>> gen.clear()
+        >>> next(g)
+        Traceback (most recent call last):
+        ...
+        ValueError: Memoized generator has been cleared.
+        >>> list(islice(gen(), 3))
+        [0, 1, 2]
+        """
+        self.__cache = []
+        self.__iter = None
+        self.__empty = False
+        self.__offset = 0
+    
+    def __trim(self):
+        # Discard all but the last window terms if the cache has grown
+        # past twice the window
+        cache = self.__cache
+        excess = len(cache) - self.window
+        if excess > self.window:
+            del cache[:excess]
+            self.__offset += excess
+    
+    def __discarded(self, n):
+        return IndexError("Term %d of memoized generator has been discarded." % n)
+    
+    def __cleared(self):
+        return ValueError("Memoized generator has been cleared.")
+    
+    def cached(self, start=0, stop=None):
+        """Return a list of the memoized terms from ``start`` to ``stop``.
+        
+        This never advances the underlying generator; the list is
+        shorter than requested if not enough terms have been computed,
+        or if some of them have been discarded (see ``setwindow``).
+        """
+        offset = self.__offset
+        return self.__cache[max(start - offset, 0):(stop - offset if stop is not None else None)]
+    
+    def block(self, start, stop):
+        """Return a list of the terms from ``start`` to ``stop``, computing them if needed.
+        
+        This lets a consumer take a run of terms with one call instead of
+        resuming a realization for each; the generator must have been
+        realized at least once, so that the underlying generator exists.
+        The list is shorter than requested only if the generator is
+        exhausted first.
+        
+        >>> def squares():
+        ...     for n in count():
+        ...         yield n * n
+        ...
+        >>> gen = MemoizedGenerator(squares)
+        >>> g = gen()
+        >>> gen.block(2, 5)
+        [4, 9, 16]
+        >>> next(g), gen.cached()
+        (0, [0, 1, 4, 9, 16])
+        """
+        cache = self.__cache
+        offset = self.__offset
+        if start < offset:
+            raise self.__discarded(start)
+        if (self.__iter is None) and not self.__empty:
+            raise ValueError("Memoized generator has not been realized.")
+        start, stop = start - offset, stop - offset
+        if self.instrumented:
+            self.hits += max(min(stop, len(cache)) - start, 0)
+        while (len(cache) < stop) and not self.__empty:
+            try:
+                if self.instrumented:
+                    cache.append(self.__timednext())
+                    self.misses += 1
+                else:
+                    cache.append(next(self.__iter))
+            except StopIteration:
+                self.__empty = True
+        terms = cache[start:stop]
+        if self.window is not None:
+            self.__trim()
+        return terms
+    
+    def run(self, start, size):
+        """Return a list of the memoized terms from ``start`` on, at most ``size`` of them.
+        
+        If there are none, the generator is advanced by one term (as with
+        ``block``), so the list holds just that term, or is empty if the
+        generator is exhausted.
+        """
+        cache = self.__cache
+        i = start - self.__offset
+        if 0 <= i < len(cache):
+            terms = cache[i:i + size]
+            if self.instrumented:
+                self.hits += len(terms)
+            return terms
+        if self.instrumented or self.__empty or (i != len(cache)) or (self.__iter is None):
+            return self.block(start, start + 1)
+        # The common case of advancing by one term, inlined
+        try:
+            term = next(self.__iter)
+        except StopIteration:
+            self.__empty = True
+            return []
+        cache.append(term)
+        if self.window is not None:
+            self.__trim()
+        return [term]
+    
+    def __timednext(self):
+        # Advance the underlying generator, calling the tracer hooks, and
+        # add the time spent to our elapsed time, less the time spent in
+        # the advances of other generators nested inside this one
+        tracer = self.tracer
+        if tracer:
+            tracer.push(self)
+        timing = self._timing
+        timing.append(0.0)
+        start = default_timer()
+        try:
+            return next(self.__iter)
+        finally:
+            elapsed = default_timer() - start
+            self.elapsed += elapsed - timing.pop()
+            if timing:
+                timing[-1] += elapsed
+            if tracer:
+                tracer.pop(self)
+    
+    def _memoized(self, cache):
+        # The plain memoized generator; the cache is replaced when we
+        # are cleared, so a realization made before that is stale
         for n in count():
+            if self.__cache is not cache:
+                raise self.__cleared()
             # First check the cache
-            if n < len(self.__cache):
-                yield self.__cache[n]
+            i = n - self.__offset
+            if i < len(cache):
+                if i < 0:
+                    raise self.__discarded(n)
+                yield cache[i]
             # See if another copy of the generator emptied it
             # since our last iteration
             elif self.__empty:
@@ -148,8 +442,39 @@ class MemoizedGenerator(object):
                     self.__empty = True
                     break
                 else:
-                    self.__cache.append(term)
+                    cache.append(term)
+                    if self.window is not None:
+                        self.__trim()
                     yield term
+    
+    def _counted(self, cache):
+        # Same as above but updating the instrumentation counters
+        # and calling the tracer hooks
+        for n in count():
+            if self.__cache is not cache:
+                raise self.__cleared()
+            tracer = self.tracer
+            i = n - self.__offset
+            if i < len(cache):
+                if i < 0:
+                    raise self.__discarded(n)
+                self.hits += 1
+                if tracer:
+                    tracer.hit(self)
+                yield cache[i]
+            elif self.__empty:
+                break
+            else:
+                try:
+                    term = self.__timednext()
+                except StopIteration:
+                    self.__empty = True
+                    break
+                self.misses += 1
+                cache.append(term)
+                if self.window is not None:
+                    self.__trim()
+                yield term
 
 
 if __name__ == '__main__':
@@ -0,0 +1,162 @@
+#! /usr/bin/env python
+"""
+Copyright (C) 2011 by Peter A. Donis.
+Released under the open source MIT license:
+http://www.opensource.org/licenses/MIT
+
+Sequence acceleration transforms. Summing a series close to the edge
+of its circle of convergence, such as the alternating harmonic series
+(log(1 + x)) or the arctangent at x = 1, takes thousands of terms to
+get even a few significant figures. The functions in this module take
+the nonzero terms of a series and its partial sums and return a better
+estimate of the limit than the last partial sum; each works with either
+fractions or floats. They are used by ``PowerFunction.accelerate``,
+which looks them up in the ``transforms`` dict by name.
+
+The partial sums of the alternating harmonic series at x = 1 converge
+to log(2) with an error of about 1/n after n terms; the transforms do
+much better with 20 terms:
+
+    >>> from math import log
+    >>> terms = [Fraction((-1) ** n, n + 1) for n in xrange(20)]
+    >>> sums = partialsums(terms)
+    >>> abs(float(sums[-1]) - log(2)) > 0.01
+    True
+    >>> for name in ('euler', 'aitken', 'wynn', 'levin'):
+    ...     print name, abs(float(transforms[name](terms, sums)) - log(2)) < 1e-7
+    euler True
+    aitken True
+    wynn True
+    levin True
+
+The transforms for general sequences (all but ``euler``) return the
+last partial sum unchanged when there are too few terms to transform,
+or when the transform would divide by zero (which happens when the
+sums have already converged exactly, for example for a polynomial).
+Integers are taken as fractions, so the divisions are exact:
+
+    >>> aitken([1, 2, 3], [1, 3, 6]), wynn([1, 2, 3], [1, 3, 6])
+    (Fraction(-3, 1), Fraction(-3, 1))
+"""
+
+from fractions import Fraction
+
+
+def _fractions(values):
+    # Convert the integers in values to fractions, so that dividing them
+    # is not floor division
+    return [Fraction(v) if isinstance(v, (int, long)) else v for v in values]
+
+
+def partialsums(terms):
+    """Return the list of partial sums of ``terms``.
+    """
+    result = []
+    s = 0
+    for t in terms:
+        s += t
+        result.append(s)
+    return result
+
+
+def euler(terms, sums):
+    """The Euler transform, for alternating series.
+
+    With b(k) = (-1)^k a(k), the sum of the a(k) is the sum over n
+    of (-1)^n (D^n b)(0) / 2^(n + 1), where D is the forward difference
+    operator; for a series whose terms alternate in sign and decrease
+    smoothly in size, the differences decrease geometrically, so the
+    error after n terms is about 2^-n, which is slower than the other
+    transforms but does not depend on the sums at all.
+    """
+    b = [t if k % 2 == 0 else -t for k, t in enumerate(terms)]
+    result = 0
+    scale = Fraction(1, 2)
+    for n in xrange(len(b)):
+        result += b[0] * scale if n % 2 == 0 else -b[0] * scale
+        b = [b[k + 1] - b[k] for k in xrange(len(b) - 1)]
+        scale /= 2
+    return result
+
+
+def aitken(terms, sums):
+    """Iterated Aitken delta-squared transform.
+
+    Each pass replaces the sequence s by s(k + 2) - (D s(k + 1))^2 / D^2 s(k),
+    which is exact if the errors of the sums decrease geometrically; the
+    passes are repeated as long as there are three values left.
+    """
+    s = _fractions(sums)
+    while len(s) >= 3:
+        t = []
+        for k in xrange(len(s) - 2):
+            d2 = s[k + 2] - 2 * s[k + 1] + s[k]
+            if not d2:
+                return s[-1]
+            t.append(s[k + 2] - (s[k + 2] - s[k + 1]) ** 2 / d2)
+        s = t
+    return s[-1] if s else 0
+
+
+def wynn(terms, sums):
+    """Wynn's epsilon algorithm, which computes the Shanks transforms.
+
+    The table has e(-1, n) = 0 and e(0, n) = s(n), and each column is
+    computed from the two before it by
+
+        e(k + 1, n) = e(k - 1, n + 1) + 1 / (e(k, n + 1) - e(k, n))
+
+    the even columns are the estimates, and the last entry of the last
+    even column computed is returned.
+    """
+    if not sums:
+        return 0
+    prev, cur = [0] * (len(sums) + 1), _fractions(sums)
+    result = cur[-1]
+    k = 0
+    while len(cur) > 1:
+        diffs = [cur[n + 1] - cur[n] for n in xrange(len(cur) - 1)]
+        if not all(diffs):
+            break
+        prev, cur = cur, [prev[n + 1] + 1 / d for n, d in enumerate(diffs)]
+        k += 1
+        if k % 2 == 0:
+            result = cur[-1]
+    return result
+
+
+def levin(terms, sums, beta=1):
+    """The Levin u transform.
+
+    The remainder after the partial sum s(n) is modeled by the remainder
+    estimate (beta + n) a(n) times a polynomial in 1 / (beta + n); with
+    k + 1 sums, the transform is the ratio of
+
+        sum over j of (-1)^j binomial(k, j) ((beta + j) / (beta + k))^(k - 1) s(j) / w(j)
+
+    to the same sum with s(j) replaced by 1, where w(j) = (beta + j) a(j).
+    """
+    k = len(sums) - 1
+    if k < 1:
+        return sums[-1] if sums else 0
+    num = den = 0
+    binom = 1
+    for j in xrange(k + 1):
+        w = (beta + j) * terms[j]
+        c = binom * Fraction(beta + j, beta + k) ** (k - 1) / w
+        if j % 2:
+            c = -c
+        num += c * sums[j]
+        den += c
+        binom = binom * (k - j) // (j + 1)
+    if not den:
+        return sums[-1]
+    return num / den
+
+
+transforms = dict(euler=euler, aitken=aitken, wynn=wynn, levin=levin)
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,119 @@
+#! /usr/bin/env python
+"""
+Copyright (C) 2011 by Peter A. Donis.
+Released under the open source MIT license:
+http://www.opensource.org/licenses/MIT
+
+Profiling of the bit sizes of rational numbers. The cost of the
+arithmetic in ``powerseries.py`` and ``powerfunc.py`` is driven by
+the size of the numerators and denominators of the ``Fraction``
+objects involved, so it is useful to be able to see how those sizes
+grow from one term of a series to the next, and to be warned when
+they grow abnormally fast.
+
+The size of a fraction is given as a tuple of the bit lengths of its
+numerator and denominator:
+
+    >>> from fractions import Fraction
+    >>> bits(Fraction(-5, 16))
+    (3, 5)
+    >>> bits(Fraction.from_float(0.1))
+    (52, 56)
+
+The growth of a sequence of sizes is measured as the average number
+of bits (numerator plus denominator) added per term over the first
+and the second half of the sequence. Coefficients of well-behaved
+series grow roughly linearly, so the two rates are comparable; the
+terms of the exponential series, for example, have factorial
+denominators, which grow only slightly faster than linearly:
+
+    >>> from math import factorial
+    >>> sizes = [bits(Fraction(1, factorial(n))) for n in xrange(40)]
+    >>> first, second = growth(sizes)
+    >>> 1 < second / first < 2
+    True
+    >>> checkgrowth(sizes, "exp")
+    True
+
+Sizes that grow by more than ``growth_max`` bits per term, or whose
+growth rate more than multiplies by ``acceleration_max`` from the first
+half of the sequence to the second (once it is past ``acceleration_min``
+bits per term, since the first few terms of any series are small), are
+flagged by ``checkgrowth`` with a ``BitGrowthWarning``:
+
+    >>> import warnings
+    >>> warnings.simplefilter('error', BitGrowthWarning)
+    >>> checkgrowth([bits(Fraction(1, 2 ** (n * n))) for n in xrange(20)], "squares")
+    Traceback (most recent call last):
+    ...
+    BitGrowthWarning: squares: bit sizes accelerate from 10.0 to 29.0 bits per term
+    >>> warnings.resetwarnings()
+"""
+
+import warnings
+
+
+growth_max = 64
+acceleration_max = 2
+acceleration_min = 8
+
+
+class BitGrowthWarning(UserWarning): pass
+
+
+def bitlength(n):
+    """Return the number of bits in the absolute value of the integer ``n``.
+    """
+    return len(bin(abs(n))) - 2 if n else 0
+
+
+def bits(x):
+    """Return the bit lengths of the numerator and denominator of ``x``.
+
+    Works for ``Fraction`` objects and integers.
+    """
+    return (bitlength(x.numerator), bitlength(x.denominator))
+
+
+def growth(sizes):
+    """Return the average growth per term of ``sizes`` over each half.
+
+    ``sizes`` is a sequence of tuples as returned by ``bits``; the
+    result is a tuple of two floats, giving the average number of
+    bits (numerator plus denominator) added per term over the first
+    and the second half of the sequence.
+    """
+    totals = [sum(s) for s in sizes]
+    half = len(totals) // 2
+    if half < 2:
+        return (0.0, 0.0)
+    first = float(totals[half] - totals[0]) / half
+    second = float(totals[-1] - totals[half]) / (len(totals) - 1 - half)
+    return (first, second)
+
+
+def checkgrowth(sizes, label):
+    """Warn if ``sizes`` grows abnormally fast; return ``True`` if not.
+
+    The sizes are flagged with a ``BitGrowthWarning`` if they grow by
+    more than the module field ``growth_max`` bits per term over the
+    second half of the sequence, or if the growth rate over the second
+    half is more than ``acceleration_min`` bits per term and more than
+    ``acceleration_max`` times that over the first half. ``label``
+    names the quantity in the warning message.
+    """
+    first, second = growth(sizes)
+    if second > growth_max:
+        message = "%s: bit sizes grow by %.1f bits per term" % (label, second)
+    elif (second > acceleration_min) and (second > acceleration_max * first):
+        message = "%s: bit sizes accelerate from %.1f to %.1f bits per term" % (
+            label, first, second)
+    else:
+        return True
+    warnings.warn(message, BitGrowthWarning, stacklevel=2)
+    return False
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -143,6 +143,15 @@ each time, even for values that compare equal:
     False
     >>> (t15.args == t16.args) and (t15.kwds == t16.kwds)
     True
+
+The cache itself is available as the ``_instance_cache`` field of
+the decorated class, for code that needs to inspect it (for example,
+to see how much memory it holds):
+
+    >>> len(Test._instance_cache)
+    10
+    >>> Test._instance_cache[(Test, 0)] is t6
+    True
     
 """
 
@@ -165,6 +174,7 @@ def cached_class(klass):
         # The wraps decorator can't do this because __doc__
         # isn't writable once the class is created
         __doc__ = klass.__doc__
+        _instance_cache = cache
         def __new__(cls, *args, **kwds):
             key = (cls,) + args + tuple(kwds.iteritems())
             try:
@@ -0,0 +1,202 @@
+#! /usr/bin/env python
+"""
+Copyright (C) 2011 by Peter A. Donis.
+Released under the open source MIT license:
+http://www.opensource.org/licenses/MIT
+
+Guessing recurrences for power series. A series built from other
+series by composition, inversion or reciprocals costs O(n) or more
+operations per term, even when its terms happen to satisfy a simple
+recurrence that would give them at constant cost. The functions in
+this module take the first terms of a series and try to find such a
+recurrence; if they succeed, and the recurrence reproduces a number
+of further terms that were not used to find it, they return a new
+series that computes the rest of its terms from the recurrence.
+
+Two kinds of recurrence are tried: linear recurrences with constant
+coefficients, found with the Berlekamp-Massey algorithm, which give
+a ``RationalSeries``, and linear differential equations with
+polynomial coefficients, found by solving for the Hermite-Pade
+approximant of the series and its derivatives that vanishes to high
+order, which give a ``HolonomicSeries``:
+
+    >>> from powerseries import nthpower, expseries, sinseries, sqrt, log
+    >>> ONE = nthpower(0)
+    >>> X = nthpower(1)
+    >>> S = guess(ONE / (ONE - X - X * X))
+    >>> type(S).__name__, S.Q
+    ('RationalSeries', (Fraction(1, 1), Fraction(-1, 1), Fraction(-1, 1)))
+    >>> S = guess(sqrt(ONE + X))
+    >>> type(S).__name__, S.order
+    ('HolonomicSeries', 1)
+    >>> S == sqrt(ONE + X)
+    True
+    >>> guess(log(X) * expseries()).order
+    2
+    >>> guess(sinseries().compose(log(X))).order
+    2
+
+If no recurrence is found, ``None`` is returned:
+
+    >>> from powerseries import tanseries
+    >>> print guess(tanseries())
+    None
+
+Note that a guess that passes the check is still only a guess; the
+more terms are checked, the less likely it is to be wrong.
+"""
+
+from fractions import Fraction
+from itertools import islice
+
+from holonomic import HolonomicSeries
+from polynomial import pnorm
+from rational import RationalSeries
+
+
+def _terms(S, num):
+    terms = list(islice(S, num))
+    if len(terms) < num:
+        raise ValueError("Series has fewer than %d terms." % num)
+    return terms
+
+
+def _berlekampmassey(a):
+    # Return the shortest connection polynomial C, with C[0] = 1, and
+    # its length L, such that sum of C[j] a[n - j] is zero for L <= n
+    C, B = [Fraction(1, 1)], [Fraction(1, 1)]
+    L, m, b = 0, 1, Fraction(1, 1)
+    for n in xrange(len(a)):
+        d = a[n] + sum(C[j] * a[n - j] for j in xrange(1, min(L, len(C) - 1) + 1))
+        if d == 0:
+            m += 1
+            continue
+        T = list(C)
+        c = d / b
+        C.extend([Fraction(0, 1)] * (len(B) + m - len(C)))
+        for j, t in enumerate(B):
+            C[j + m] -= c * t
+        if 2 * L <= n:
+            L, B, b, m = n + 1 - L, T, d, 1
+        else:
+            m += 1
+    return C[:L + 1] + [Fraction(0, 1)] * (L + 1 - len(C)), L
+
+
+def _nullvector(rows, ncols):
+    # Return a nonzero solution of the homogeneous linear system with
+    # the given rows, or None if there is none
+    rows = [list(r) for r in rows]
+    pivots = []
+    i = 0
+    for j in xrange(ncols):
+        for k in xrange(i, len(rows)):
+            if rows[k][j]:
+                break
+        else:
+            continue
+        rows[i], rows[k] = rows[k], rows[i]
+        p = rows[i][j]
+        rows[i] = [t / p for t in rows[i]]
+        for k in xrange(len(rows)):
+            if (k != i) and rows[k][j]:
+                f = rows[k][j]
+                rows[k] = [t - f * s for t, s in zip(rows[k], rows[i])]
+        pivots.append(j)
+        i += 1
+    free = [j for j in xrange(ncols) if j not in pivots]
+    if not free:
+        return None
+    v = [Fraction(0, 1)] * ncols
+    v[free[0]] = Fraction(1, 1)
+    for k, j in enumerate(pivots):
+        v[j] = - rows[k][free[0]]
+    return v
+
+
+def _matches(G, terms):
+    return list(islice(G, len(terms))) == terms
+
+
+def guessrational(S, num=30, check=10):
+    """Guess a constant coefficient linear recurrence for ``S``.
+
+    The first ``num`` terms of ``S`` are used to find the recurrence,
+    which must be of order at most ``num / 2``, and the next ``check``
+    terms are used to check it. Returns a ``RationalSeries`` or ``None``.
+    """
+    terms = _terms(S, num + check)
+    C, L = _berlekampmassey(terms[:num])
+    if 2 * L > num:
+        return None
+    P = [sum(C[j] * terms[n - j] for j in xrange(n + 1)) for n in xrange(L)]
+    G = RationalSeries(P, C)
+    return G if _matches(G, terms) else None
+
+
+def guessholonomic(S, num=30, check=10, maxorder=4, maxdegree=4):
+    """Guess a linear differential equation with polynomial coefficients for ``S``.
+
+    Equations of order up to ``maxorder`` with coefficients of degree up
+    to ``maxdegree`` are tried, smallest first; the coefficient of each
+    power of x in the equation is a linear condition on the unknown
+    polynomial coefficients, and the conditions from the first ``num``
+    terms of ``S`` must leave a nonzero solution, with at least five more
+    conditions than unknowns. The next ``check`` terms are used to check
+    the solution. Returns a ``HolonomicSeries`` or ``None``.
+    """
+    terms = _terms(S, num + check)
+    sizes = sorted(((r + 1) * (d + 1), r, d)
+                   for r in xrange(1, maxorder + 1) for d in xrange(maxdegree + 1))
+    for size, r, d in sizes:
+        # Conditions on x^N only involve terms up to index N + r
+        neqs = num - r
+        if neqs < size + 5:
+            continue
+        # Unknown i * (d + 1) + k is the coefficient of x^k y^(i); it contributes
+        # ff(N + i - k, i) a(N + i - k) to the coefficient of x^N
+        rows = []
+        for N in xrange(neqs):
+            row = []
+            for i in xrange(r + 1):
+                for k in xrange(d + 1):
+                    n = N + i - k
+                    f = 0
+                    if n >= i:
+                        f = terms[n]
+                        for t in xrange(i):
+                            f *= n - t
+                    row.append(f)
+            rows.append(row)
+        v = _nullvector(rows, size)
+        if v is None:
+            continue
+        ode = [pnorm(v[i * (d + 1):(i + 1) * (d + 1)]) for i in xrange(r + 1)]
+        while ode and not ode[-1]:
+            ode.pop()
+        if len(ode) < 2:
+            continue
+        try:
+            G = HolonomicSeries(ode, terms)
+        except ValueError:
+            continue
+        if _matches(G, terms):
+            return G
+    return None
+
+
+def guess(S, num=30, check=10, maxorder=4, maxdegree=4):
+    """Guess a recurrence for ``S``, trying constant coefficients first.
+
+    Returns the ``RationalSeries`` or ``HolonomicSeries`` found by
+    ``guessrational`` or ``guessholonomic``, or ``None``.
+    """
+    G = guessrational(S, num, check)
+    if G is None:
+        G = guessholonomic(S, num, check, maxorder, maxdegree)
+    return G
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
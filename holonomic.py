@@ -0,0 +1,453 @@
+#! /usr/bin/env python
+"""
+Copyright (C) 2011 by Peter A. Donis.
+Released under the open source MIT license:
+http://www.opensource.org/licenses/MIT
+
+D-finite (holonomic) power series. A series is holonomic if it
+satisfies a linear ordinary differential equation with polynomial
+coefficients,
+
+    p0(x) y + p1(x) y' + ... + pr(x) y^(r) = 0
+
+Comparing coefficients of each power of x turns the equation into
+a linear recurrence for the terms of the series, whose coefficients
+are polynomials in the index (a "P-recurrence"), so each term can
+be computed from a fixed number of earlier terms with a constant
+number of operations; see ``FORMULAS.md`` for the details. Most of
+the example series in ``powerseries.py`` are holonomic; the ones
+that are not are those, like the tangent and secant, that involve
+reciprocals of other series.
+
+The ``HolonomicSeries`` class in this module is a ``PowerSeries``
+defined by such an equation and enough initial terms. Holonomic
+series are closed under addition, multiplication, differentiation,
+integration and the substitution of c * x**k for x, and these
+operations on a ``HolonomicSeries`` return a new one with a new
+equation, so products of holonomic series cost a constant number
+of operations per term, instead of the O(n) per term of the general
+``PowerSeries`` multiplication:
+
+    >>> import powerseries
+    >>> EXP = expseries()
+    >>> SIN = sinseries()
+    >>> COS = cosseries()
+    >>> EXP == powerseries.expseries()
+    True
+    >>> SC = SIN * COS
+    >>> isinstance(SC, HolonomicSeries), SC.order
+    (True, 3)
+    >>> SC == powerseries.sinseries() * powerseries.cosseries()
+    True
+    >>> SIN * SIN + COS * COS == powerseries.nthpower(0)
+    True
+    >>> SIN.derivative() == COS
+    True
+    >>> COS.integral() == SIN
+    True
+    >>> EXP.substitute(Fraction(-1, 1), 2) == powerseries.exp(- powerseries.nthpower(2))
+    True
+    >>> ARCTAN = arctanseries()
+    >>> D = ARCTAN.derivative()
+    >>> D.order, D == powerseries.arctanseries().derivative()
+    (1, True)
+    >>> (EXP * ARCTAN + SIN) == (powerseries.expseries() * powerseries.arctanseries()
+    ...                          + powerseries.sinseries())
+    True
+
+Operations with series that are not holonomic (or not known to be,
+because they are not instances of this class) fall back to the
+general ``PowerSeries`` operations.
+"""
+
+from fractions import Fraction
+from itertools import count, islice
+
+from polynomial import padd, pderiv, pdivmod, peval, pgcd, pmul, pnorm, pscale, psub
+from powerseries import PowerSeries
+
+
+# Rational functions are pairs (numerator, denominator) of polynomials,
+# with no common factors and a monic denominator
+
+_RZERO = ((), (Fraction(1, 1),))
+_RONE = ((Fraction(1, 1),), (Fraction(1, 1),))
+
+
+def _rnorm(n, d):
+    if not n:
+        return _RZERO
+    g = pgcd(n, d)
+    if len(g) > 1:
+        n, d = pdivmod(n, g)[0], pdivmod(d, g)[0]
+    c = d[-1]
+    return (pscale(n, 1 / c), pscale(d, 1 / c))
+
+
+def _radd(r, s):
+    return _rnorm(padd(pmul(r[0], s[1]), pmul(s[0], r[1])), pmul(r[1], s[1]))
+
+
+def _rmul(r, s):
+    return _rnorm(pmul(r[0], s[0]), pmul(r[1], s[1]))
+
+
+def _rdiv(r, s):
+    return _rnorm(pmul(r[0], s[1]), pmul(r[1], s[0]))
+
+
+def _rneg(r):
+    return (pscale(r[0], -1), r[1])
+
+
+def _rderiv(r):
+    n, d = r
+    return _rnorm(psub(pmul(pderiv(n), d), pmul(n, pderiv(d))), pmul(d, d))
+
+
+def _ff(j, i):
+    # Falling factorial j (j - 1) ... (j - i + 1)
+    result = 1
+    for t in xrange(i):
+        result *= j - t
+    return result
+
+
+class _Recurrence(object):
+    # The recurrence for the terms of a series satisfying an equation;
+    # the coefficient of x**N in x**k y^(i) is ff(N + i - k, i) a(N + i - k),
+    # so with the largest shift i - k equal to S, each equation determines
+    # a(N + S) from earlier terms, unless its coefficient q(N) is zero
+
+    def __init__(self, ode):
+        entries = [(i - k, i, c) for i, p in enumerate(ode) for k, c in enumerate(p) if c]
+        if not entries:
+            raise ValueError("Differential equation must have a nonzero coefficient.")
+        S = self.shift = max(d for d, i, c in entries)
+        self.lead = [(i, c) for d, i, c in entries if d == S]
+        self.rest = [(d, i, c) for d, i, c in entries if d < S]
+        # Find the nonnegative integer roots of q(N) as a polynomial in N;
+        # the terms at those indexes (plus any before the shift) must be
+        # given as initial terms
+        q = ()
+        for i, c in self.lead:
+            f = (Fraction(1, 1),)
+            for t in xrange(i):
+                f = pmul(f, (Fraction(S - t), Fraction(1, 1)))
+            q = padd(q, pscale(f, c))
+        bound = 1 + max([abs(c / q[-1]) for c in q[:-1]] or [0])
+        roots = [N for N in xrange(int(bound) + 1) if peval(q, N) == 0]
+        self.needed = max([max(S, 0)] + [N + S + 1 for N in roots])
+
+    def term(self, m, a):
+        # Return term m given the list a of all earlier terms
+        N = m - self.shift
+        q = sum(c * _ff(m, i) for i, c in self.lead)
+        rest = sum(c * _ff(N + d, i) * a[N + d] for d, i, c in self.rest if N + d >= 0)
+        return - rest / q
+
+
+def _relation(start, derive):
+    # Given the coordinates of a function h, as a list of rational functions
+    # with respect to some basis of functions, and a function that maps the
+    # coordinates of any function to those of its derivative, return the
+    # polynomial coefficients of the lowest order linear differential
+    # equation satisfied by h; this is just Gaussian elimination over the
+    # rational functions, adding one derivative of h at a time until they
+    # become linearly dependent
+    echelon = []
+    v = start
+    for N in count():
+        w = list(v)
+        comb = [_RZERO] * N + [_RONE]
+        for pivot, row, rcomb in echelon:
+            if w[pivot][0]:
+                f = _rdiv(w[pivot], row[pivot])
+                w = [_radd(a, _rneg(_rmul(f, b))) for a, b in zip(w, row)]
+                comb = [_radd(a, _rneg(_rmul(f, b))) for a, b in zip(comb, rcomb + [_RZERO] * (N + 1 - len(rcomb)))]
+        pivots = [j for j, r in enumerate(w) if r[0]]
+        if not pivots:
+            break
+        echelon.append((pivots[0], w, comb))
+        v = derive(v)
+    # Clear denominators and remove any common polynomial factor
+    den = (Fraction(1, 1),)
+    for n, d in comb:
+        den = pdivmod(pmul(den, d), pgcd(den, d))[0]
+    ode = [pmul(n, pdivmod(den, d)[0]) for n, d in comb]
+    g = ()
+    for p in ode:
+        g = pgcd(g, p) if g else pgcd(p, ())
+    return tuple(pdivmod(p, g)[0] if p else p for p in ode)
+
+
+def _reducer(ode):
+    # Return a function that adds c times the derivative of the basis
+    # function of index j to the coordinate list v, for the basis of the
+    # first r derivatives of a function satisfying ode
+    r = len(ode) - 1
+    lead = (ode[r], (Fraction(1, 1),))
+    coeffs = [_rneg(_rdiv((p, (Fraction(1, 1),)), lead)) for p in ode[:r]]
+    def _add(v, j, c, offset=0, stride=1):
+        if j + 1 < r:
+            k = offset + (j + 1) * stride
+            v[k] = _radd(v[k], c)
+        else:
+            for t, f in enumerate(coeffs):
+                if f[0]:
+                    k = offset + t * stride
+                    v[k] = _radd(v[k], _rmul(c, f))
+    return _add
+
+
+class HolonomicSeries(PowerSeries):
+    """A power series defined by a linear differential equation.
+
+    The equation is given by ``ode``, a sequence of the polynomial
+    coefficients p0, p1, ..., pr of y, y', ..., y^(r), each of which
+    is a sequence of its coefficients, lowest degree first; ``init``
+    gives the initial terms of the series. At least ``needed`` initial
+    terms (a field of the instance) must be given, and they must be
+    consistent with the equation; any further terms are ignored.
+
+    For example, the exponential series is the solution of y' - y = 0
+    with first term 1:
+
+    >>> HolonomicSeries([[-1], [1]], [1]) == expseries()
+    True
+    """
+
+    def __new__(cls, ode, init):
+        ode = tuple(pnorm(p) for p in ode)
+        while ode and not ode[-1]:
+            ode = ode[:-1]
+        rec = _Recurrence(ode)
+        init = tuple(Fraction(t) for t in islice(init, rec.needed))
+        if len(init) < rec.needed:
+            raise ValueError("Differential equation requires %d initial terms." % rec.needed)
+        def _hol():
+            a = list(init)
+            for t in a:
+                yield t
+            for m in count(len(a)):
+                t = rec.term(m, a)
+                a.append(t)
+                yield t
+        self = PowerSeries.__new__(cls, _hol)
+        self.ode = ode
+        self.needed = rec.needed
+        self.__init = init
+        self.__ops = {}
+        return self
+
+    @property
+    def order(self):
+        """The order of our differential equation.
+        """
+        return len(self.ode) - 1
+
+    def _result(self, key, ode, terms):
+        # Return the cached result of an operation, or construct it from
+        # its differential equation and an iterable of its terms
+        if key not in self.__ops:
+            rec = _Recurrence(ode)
+            self.__ops[key] = HolonomicSeries(ode, islice(terms, rec.needed))
+        return self.__ops[key]
+
+    def __add__(self, other):
+        """Return a HolonomicSeries for self + other if other is holonomic.
+
+        Numbers are holonomic (they satisfy y' = 0).
+        """
+        if isinstance(other, Fraction):
+            other = constant(other)
+        if not isinstance(other, HolonomicSeries):
+            return PowerSeries.__add__(self, other)
+        r1, r2 = self.order, other.order
+        add1, add2 = _reducer(self.ode), _reducer(other.ode)
+        def derive(v):
+            w = [_rderiv(c) for c in v]
+            for j in xrange(r1):
+                if v[j][0]:
+                    add1(w, j, v[j])
+            for j in xrange(r2):
+                if v[r1 + j][0]:
+                    add2(w, j, v[r1 + j], offset=r1)
+            return w
+        start = [_RZERO] * (r1 + r2)
+        start[0] = start[r1] = _RONE
+        ode = _relation(start, derive)
+        return self._result(('add', id(other)), ode, PowerSeries.__add__(self, other))
+
+    __radd__ = __add__
+
+    def __mul__(self, other):
+        """Return a HolonomicSeries for self * other if other is holonomic.
+        """
+        if isinstance(other, Fraction):
+            if other == 0:
+                return PowerSeries()
+            return self._result(('mul', other), self.ode, (other * t for t in self))
+        if not isinstance(other, HolonomicSeries):
+            return PowerSeries.__mul__(self, other)
+        r1, r2 = self.order, other.order
+        add1, add2 = _reducer(self.ode), _reducer(other.ode)
+        def derive(v):
+            # Coordinate i * r2 + j is the coefficient of f^(i) g^(j)
+            w = [_rderiv(c) for c in v]
+            for i in xrange(r1):
+                for j in xrange(r2):
+                    c = v[i * r2 + j]
+                    if c[0]:
+                        add1(w, i, c, offset=j, stride=r2)
+                        add2(w, j, c, offset=i * r2)
+            return w
+        start = [_RZERO] * (r1 * r2)
+        start[0] = _RONE
+        ode = _relation(start, derive)
+        return self._result(('mul', id(other)), ode, PowerSeries.__mul__(self, other))
+
+    __rmul__ = __mul__
+
+    def derivative(self):
+        """Return a HolonomicSeries for the derivative of this one.
+
+        If p0 is zero, the equation for y' is just the one for y with
+        every derivative lowered by one; otherwise, solving for y in
+        terms of y' and its derivatives and differentiating gives
+
+            p0^2 y' + p0 (p1 y'' + p1' y' + ...) - p0' (p1 y' + ...) = 0
+        """
+        p = self.ode
+        if not p[0]:
+            ode = p[1:]
+        else:
+            ode = [pmul(p[0], p[0])] + [()] * (len(p) - 1)
+            for i in xrange(1, len(p)):
+                ode[i - 1] = padd(ode[i - 1], psub(pmul(p[0], pderiv(p[i])),
+                                                     pmul(pderiv(p[0]), p[i])))
+                ode[i] = padd(ode[i], pmul(p[0], p[i]))
+        return self._result('derivative', ode, PowerSeries.derivative(self))
+
+    def integral(self, const=Fraction(0, 1)):
+        """Return a HolonomicSeries for the integral of this one.
+
+        The integral z of y satisfies the equation for y with every
+        derivative raised by one, since z' = y.
+        """
+        ode = ((),) + self.ode
+        return self._result(('integral', const), ode, PowerSeries.integral(self, const))
+
+    def substitute(self, c, k=1):
+        """Return a HolonomicSeries for this one with c * x**k substituted for x.
+
+        We write the equation in terms of the operator theta = t d/dt, using
+        t^i D^i = theta (theta - 1) ... (theta - i + 1), multiplied through by
+        t^r; substituting t = c x^k turns theta into 1/k x d/dx, and powers of
+        x d/dx are converted back to derivatives with the Stirling numbers of
+        the second kind.
+        """
+        c, r = Fraction(c), self.order
+        # Polynomials in theta, with coefficients that are polynomials in x,
+        # as a dict mapping powers of theta to polynomials in x
+        total = {}
+        for i, p in enumerate(self.ode):
+            # p(t) t^(r - i) with t = c x^k
+            px = [Fraction(0, 1)] * ((len(p) + r - i - 1) * k + 1) if p else []
+            for j, a in enumerate(p):
+                px[(j + r - i) * k] = a * c ** (j + r - i)
+            px = pnorm(px)
+            # theta (theta - 1) ... (theta - i + 1) with theta -> theta / k
+            f = (Fraction(1, 1),)
+            for t in xrange(i):
+                f = pmul(f, (Fraction(-t), Fraction(1, k)))
+            for j, a in enumerate(f):
+                total[j] = padd(total.get(j, ()), pscale(px, a))
+        # theta^j = sum over m of S(j, m) x^m D^m
+        ode = [()] * (max(total) + 1)
+        stirling = [[1]]
+        for j in xrange(1, len(ode)):
+            prev = stirling[-1] + [0]
+            stirling.append([0] + [m * prev[m] + prev[m - 1] for m in xrange(1, j + 1)])
+        for j, p in total.iteritems():
+            for m, s in enumerate(stirling[j]):
+                if s:
+                    xm = (Fraction(0, 1),) * m + (Fraction(s),)
+                    ode[m] = padd(ode[m], pmul(p, xm))
+        def _terms():
+            for n, t in enumerate(self):
+                yield t * c ** n
+                for i in xrange(k - 1):
+                    yield Fraction(0, 1)
+        return self._result(('substitute', c, k), ode, _terms())
+
+
+def constant(c):
+    """The constant c as a HolonomicSeries; it satisfies y' = 0.
+    """
+    return HolonomicSeries([[], [1]], [c])
+
+
+def expseries():
+    """The exponential function as a HolonomicSeries: y' - y = 0.
+    """
+    return HolonomicSeries([[-1], [1]], [1])
+
+
+def sinseries():
+    """The sine function as a HolonomicSeries: y'' + y = 0.
+    """
+    return HolonomicSeries([[1], [], [1]], [0, 1])
+
+
+def cosseries():
+    """The cosine function as a HolonomicSeries: y'' + y = 0.
+    """
+    return HolonomicSeries([[1], [], [1]], [1, 0])
+
+
+def sinhseries():
+    """The hyperbolic sine function as a HolonomicSeries: y'' - y = 0.
+    """
+    return HolonomicSeries([[-1], [], [1]], [0, 1])
+
+
+def coshseries():
+    """The hyperbolic cosine function as a HolonomicSeries: y'' - y = 0.
+    """
+    return HolonomicSeries([[-1], [], [1]], [1, 0])
+
+
+def arcsinseries():
+    """The arcsine function as a HolonomicSeries: (1 - x^2) y'' - x y' = 0.
+    """
+    return HolonomicSeries([[], [0, -1], [1, 0, -1]], [0, 1])
+
+
+def arctanseries():
+    """The arctangent function as a HolonomicSeries: (1 + x^2) y'' + 2x y' = 0.
+    """
+    return HolonomicSeries([[], [0, 2], [1, 0, 1]], [0, 1])
+
+
+def arcsinhseries():
+    """The hyperbolic arcsine function as a HolonomicSeries: (1 + x^2) y'' + x y' = 0.
+    """
+    return HolonomicSeries([[], [0, 1], [1, 0, 1]], [0, 1])
+
+
+def arctanhseries():
+    """The hyperbolic arctangent function as a HolonomicSeries: (1 - x^2) y'' - 2x y' = 0.
+    """
+    return HolonomicSeries([[], [0, -2], [1, 0, -1]], [0, 1])
+
+
+def altharmonicseries():
+    """The series for ln(1 + x) as a HolonomicSeries: (1 + x) y'' + y' = 0.
+    """
+    return HolonomicSeries([[], [1], [1, 1]], [0, 1])
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -13,6 +13,11 @@ class, ``MemoizedGenerator``, for more details on the general
 idea behind memoizing generators. See the documentation for
 the ``DelayedDecorator`` class for more details on delaying
 decoration.
+
+When the decorated generator is a method, the instance it was
+decorated for is stored in the ``owner`` field of its memoized
+generator, so that instrumentation code which only sees the
+``MemoizedGenerator`` can tell which object it belongs to.
 """
 
 from functools import partial
@@ -21,4 +26,17 @@ from DelayedDecorator import DelayedDecorator
 from MemoizedGenerator import MemoizedGenerator
 
 
-memoize_generator = partial(DelayedDecorator, MemoizedGenerator)
+class OwnedDecorator(DelayedDecorator):
+    """Delayed decorator that records the owning instance.
+    
+    The decorated function returned by the base class is assumed
+    to accept attribute assignment (``MemoizedGenerator`` does).
+    """
+    
+    def _decorated(self, cls=None, instance=None):
+        result = DelayedDecorator._decorated(self, cls, instance)
+        result.owner = instance
+        return result
+
+
+memoize_generator = partial(OwnedDecorator, MemoizedGenerator)
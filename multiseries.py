@@ -0,0 +1,335 @@
+#! /usr/bin/env python
+"""
+Copyright (C) 2011 by Peter A. Donis.
+Released under the open source MIT license:
+http://www.opensource.org/licenses/MIT
+
+Multivariate power series, with the same lazy semantics as the
+univariate ``PowerSeries`` class. A series in several variables is
+represented by a generator that yields its homogeneous parts, one
+total degree at a time; each part is a tuple of the coefficients of
+all the monomials of that degree, in a fixed order (see the function
+``monomials``), so storage is a flat tuple per degree instead of
+nested containers. Equality, ``showterms`` and truncation all work
+by total degree.
+
+    >>> from powerseries import expseries, sinseries, cosseries
+    >>> X, Y = variable(2, 0), variable(2, 1)
+    >>> E = compose(expseries(), X + Y)
+    >>> E.showterms(4)
+    1
+    1, 1
+    1/2, 1, 1/2
+    1/6, 1/2, 1/2, 1/6
+    >>> E == compose(expseries(), X) * compose(expseries(), Y)
+    True
+    >>> E.derivative(0) == E
+    True
+    >>> S = compose(sinseries(), X + Y)
+    >>> S == (compose(sinseries(), X) * compose(cosseries(), Y) +
+    ...       compose(cosseries(), X) * compose(sinseries(), Y))
+    True
+    >>> S.derivative(1) == compose(cosseries(), X + Y)
+    True
+    >>> S.derivative(0).integral(0) == S - compose(sinseries(), Y)
+    True
+    >>> S.coefficient((2, 1))
+    Fraction(-1, 2)
+
+Series can only be combined with series in the same number of variables:
+
+    >>> X + variable(3, 0)
+    Traceback (most recent call last):
+    ...
+    ValueError: MultiSeries numbers of variables must match.
+"""
+
+from fractions import Fraction
+from itertools import count, islice, izip
+
+from cached_class import cached_class
+from memoize_generator import memoize_generator
+from powerseries import PowerSeries
+
+
+# Monomial orderings and index tables, shared by all series
+
+_monomials = {}
+_indexes = {}
+_products = {}
+
+
+def monomials(nvars, n):
+    """Return the exponent tuples of the monomials of degree ``n``.
+
+    This is the order of the coefficients in each homogeneous part:
+    decreasing powers of the first variable, then of the second, and
+    so on.
+
+    >>> monomials(2, 2)
+    ((2, 0), (1, 1), (0, 2))
+    >>> len(monomials(3, 4))
+    15
+    """
+    key = (nvars, n)
+    try:
+        return _monomials[key]
+    except KeyError:
+        pass
+    if nvars == 1:
+        result = ((n,),)
+    else:
+        result = tuple((k,) + rest for k in xrange(n, -1, -1)
+                       for rest in monomials(nvars - 1, n - k))
+    _monomials[key] = result
+    _indexes[key] = dict((m, i) for i, m in enumerate(result))
+    return result
+
+
+def _index(nvars, n):
+    # Map from exponent tuples of degree n to coefficient indexes
+    monomials(nvars, n)
+    return _indexes[(nvars, n)]
+
+
+def _product(nvars, k, l):
+    # For each pair of monomial indexes of degrees k and l, the index
+    # of their product in degree k + l, as a tuple of tuples
+    key = (nvars, k, l)
+    try:
+        return _products[key]
+    except KeyError:
+        index = _index(nvars, k + l)
+        result = _products[key] = tuple(
+            tuple(index[tuple(a + b for a, b in izip(m, p))] for p in monomials(nvars, l))
+            for m in monomials(nvars, k))
+        return result
+
+
+def _zeros(nvars, n):
+    return (Fraction(0, 1),) * len(monomials(nvars, n))
+
+
+@cached_class
+class MultiSeries(object):
+    """Multivariate power series encapsulation.
+
+    Represents a power series in ``nvars`` variables as an iterable of
+    its homogeneous parts; the nth part is a tuple of the coefficients
+    of the monomials of total degree n, ordered as by ``monomials``.
+    The generator ``g`` yields the parts; if it is not given, the series
+    is empty (zero).
+    """
+
+    testlimit = 6
+
+    def __init__(self, nvars, g=None):
+        self.nvars = nvars
+        self.__g = g
+        self.__D = {}
+        self.__I = {}
+
+    @memoize_generator
+    def _gen(self):
+        """The full generator for this series, padded with zero parts.
+        """
+        n = 0
+        if self.__g:
+            for part in self.__g():
+                yield part
+                n += 1
+        for n in count(n):
+            yield _zeros(self.nvars, n)
+
+    def __iter__(self):
+        return self._gen()
+
+    def __eq__(self, other):
+        """Test MultiSeries for equality up to total degree ``testlimit``.
+        """
+        if isinstance(other, MultiSeries):
+            return (self.nvars == other.nvars) and all(
+                s == o for s, o in islice(izip(self, other), self.testlimit))
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def showterms(self, num=None):
+        """Print the first ``num`` homogeneous parts, one per line.
+        """
+        for part in islice(self, num or self.testlimit):
+            print ", ".join(str(c) for c in part)
+
+    def coefficient(self, exponents):
+        """Return the coefficient of the monomial with the given exponents.
+        """
+        n = sum(exponents)
+        part = next(islice(self, n, None))
+        return part[_index(self.nvars, n)[tuple(exponents)]]
+
+    def truncate(self, n):
+        """Return a MultiSeries with the parts of this one up to total degree n.
+        """
+        def _t():
+            for part in islice(self, n + 1):
+                yield part
+        return MultiSeries(self.nvars, _t)
+
+    def _check(self, other):
+        if other.nvars != self.nvars:
+            raise ValueError("MultiSeries numbers of variables must match.")
+    
+    def __add__(self, other):
+        if isinstance(other, Fraction):
+            other = constant(self.nvars, other)
+        if not isinstance(other, MultiSeries):
+            return NotImplemented
+        self._check(other)
+        def _a():
+            for p, q in izip(self, other):
+                yield tuple(a + b for a, b in izip(p, q))
+        return MultiSeries(self.nvars, _a)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return Fraction(-1, 1) * self
+
+    def __sub__(self, other):
+        return self + (- other)
+
+    def __rsub__(self, other):
+        return other + (- self)
+
+    def __mul__(self, other):
+        """Return a MultiSeries for the product of self and other.
+
+        The part of degree n of the product is the sum of the products of
+        the parts of degrees k and n - k of the factors; the index tables
+        for monomial products are computed once per pair of degrees.
+        """
+        nvars = self.nvars
+        if isinstance(other, Fraction):
+            if other == 1:
+                return self
+            def _m():
+                for part in self:
+                    yield tuple(other * c for c in part)
+        elif isinstance(other, MultiSeries):
+            self._check(other)
+            def _m():
+                # Parts are pulled only when the part they multiply is
+                # nonzero, so that if one factor has no constant term the
+                # part of degree n of the product needs only the parts of
+                # the other below degree n (see the compose function below)
+                A, B = [], []
+                iters = (iter(self), iter(other))
+                def _part(parts, it, k):
+                    while len(parts) <= k:
+                        parts.append(next(it))
+                    return parts[k]
+                for n in count():
+                    result = list(_zeros(nvars, n))
+                    for k in xrange(n + 1):
+                        a = _part(A, iters[0], k)
+                        if not any(a):
+                            continue
+                        b = _part(B, iters[1], n - k)
+                        table = _product(nvars, k, n - k)
+                        for i, c in enumerate(a):
+                            if c:
+                                row = table[i]
+                                for j, d in enumerate(b):
+                                    if d:
+                                        result[row[j]] += c * d
+                    yield tuple(result)
+        else:
+            return NotImplemented
+        return MultiSeries(nvars, _m)
+
+    __rmul__ = __mul__
+
+    def derivative(self, var):
+        """Return a MultiSeries for the partial derivative with respect to variable ``var``.
+        """
+        if var not in self.__D:
+            nvars = self.nvars
+            def _d():
+                for n, part in enumerate(islice(self, 1, None)):
+                    index = _index(nvars, n)
+                    result = list(_zeros(nvars, n))
+                    for m, c in izip(monomials(nvars, n + 1), part):
+                        if c and m[var]:
+                            lower = m[:var] + (m[var] - 1,) + m[var + 1:]
+                            result[index[lower]] = m[var] * c
+                    yield tuple(result)
+            self.__D[var] = MultiSeries(nvars, _d)
+        return self.__D[var]
+
+    def integral(self, var):
+        """Return a MultiSeries for the partial integral with respect to variable ``var``.
+
+        The constant of integration is zero, i.e., every term of the result
+        contains the variable ``var``.
+        """
+        if var not in self.__I:
+            nvars = self.nvars
+            def _i():
+                yield _zeros(nvars, 0)
+                for n, part in enumerate(self):
+                    index = _index(nvars, n + 1)
+                    result = list(_zeros(nvars, n + 1))
+                    for m, c in izip(monomials(nvars, n), part):
+                        if c:
+                            higher = m[:var] + (m[var] + 1,) + m[var + 1:]
+                            result[index[higher]] = Fraction(1, m[var] + 1) * c
+                    yield tuple(result)
+            self.__I[var] = MultiSeries(nvars, _i)
+        return self.__I[var]
+
+
+def constant(nvars, c):
+    """The constant ``c`` as a MultiSeries in ``nvars`` variables.
+    """
+    def _c():
+        yield (Fraction(c),)
+    return MultiSeries(nvars, _c)
+
+
+def variable(nvars, var):
+    """The variable of index ``var`` as a MultiSeries in ``nvars`` variables.
+    """
+    def _v():
+        yield _zeros(nvars, 0)
+        part = list(_zeros(nvars, 1))
+        part[var] = Fraction(1, 1)
+        yield tuple(part)
+    return MultiSeries(nvars, _v)
+
+
+def compose(S, M):
+    """Return a MultiSeries for the univariate PowerSeries ``S`` composed with ``M``.
+
+    As with ``PowerSeries.compose``, the constant term of ``M`` must be
+    zero, and we use S(M) = s0 + M * S1(M), where S1 is the tail of S;
+    since M has no constant term, the product only needs the parts of
+    S1(M) below the degree being computed, so the recursion terminates.
+    """
+    if not isinstance(S, PowerSeries):
+        raise TypeError("Can only compose a PowerSeries with a MultiSeries.")
+    if next(iter(M))[0] != 0:
+        raise ValueError("Constant term of composed MultiSeries must be 0.")
+    def _c():
+        yield (S.zero,)
+        for part in islice(M * compose(S.tail, M), 1, None):
+            yield part
+    return MultiSeries(M.nvars, _c)
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
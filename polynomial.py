@@ -0,0 +1,103 @@
+#! /usr/bin/env python
+"""
+Copyright (C) 2011 by Peter A. Donis.
+Released under the open source MIT license:
+http://www.opensource.org/licenses/MIT
+
+Arithmetic on polynomials with rational coefficients, shared by the
+modules that define series by polynomial data (``holonomic.py``,
+``rational.py`` and ``guess.py``). A polynomial is a tuple of its
+``Fraction`` coefficients, lowest degree first, with no trailing zeros,
+so the zero polynomial is the empty tuple; ``pnorm`` puts any sequence
+of coefficients in this form, and every other function here returns
+polynomials in it.
+
+    >>> p = pnorm([1, 1])
+    >>> q = pnorm([-1, 1, 0])
+    >>> q
+    (Fraction(-1, 1), Fraction(1, 1))
+    >>> pmul(p, q)
+    (Fraction(-1, 1), Fraction(0, 1), Fraction(1, 1))
+    >>> pdivmod(pmul(p, q), p) == (q, ())
+    True
+    >>> padd(p, q), psub(p, p)
+    ((Fraction(0, 1), Fraction(2, 1)), ())
+    >>> pderiv(pmul(p, q)), peval(pmul(p, q), Fraction(3, 1))
+    ((Fraction(0, 1), Fraction(2, 1)), Fraction(8, 1))
+    >>> pgcd(pmul(p, q), pscale(p, Fraction(2, 1)))
+    (Fraction(1, 1), Fraction(1, 1))
+"""
+
+from fractions import Fraction
+
+
+def pnorm(p):
+    """Return the coefficients ``p`` as a polynomial.
+    """
+    p = list(p)
+    while p and (p[-1] == 0):
+        p.pop()
+    return tuple(Fraction(c) for c in p)
+
+
+def padd(p, q):
+    if len(p) < len(q):
+        p, q = q, p
+    return pnorm([c + (q[i] if i < len(q) else 0) for i, c in enumerate(p)])
+
+
+def pscale(p, c):
+    return pnorm([c * t for t in p])
+
+
+def psub(p, q):
+    return padd(p, pscale(q, -1))
+
+
+def pmul(p, q):
+    if not (p and q):
+        return ()
+    result = [Fraction(0, 1)] * (len(p) + len(q) - 1)
+    for i, c in enumerate(p):
+        for j, d in enumerate(q):
+            result[i + j] += c * d
+    return pnorm(result)
+
+
+def pderiv(p):
+    return pnorm([k * c for k, c in enumerate(p)][1:])
+
+
+def peval(p, x):
+    result = Fraction(0, 1)
+    for c in reversed(p):
+        result = result * x + c
+    return result
+
+
+def pdivmod(p, q):
+    """Return the quotient and remainder of ``p`` divided by ``q``.
+    """
+    quot = [Fraction(0, 1)] * max(len(p) - len(q) + 1, 0)
+    rem = list(p)
+    while len(rem) >= len(q):
+        c = rem[-1] / q[-1]
+        k = len(rem) - len(q)
+        quot[k] = c
+        for j, d in enumerate(q):
+            rem[k + j] -= c * d
+        rem = list(pnorm(rem))
+    return pnorm(quot), tuple(rem)
+
+
+def pgcd(p, q):
+    """Return the monic greatest common divisor of ``p`` and ``q``.
+    """
+    while q:
+        p, q = q, pdivmod(p, q)[1]
+    return pscale(p, 1 / p[-1]) if p else p
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
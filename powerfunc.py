@@ -82,14 +82,195 @@ Test with the example functions from ``powerseries.py``:
     f(1) to 10 figures 250947670863258378883/96845140757687397075
 """
 
+import warnings
 from collections import deque
 from fractions import Fraction
 from itertools import islice
+from math import isinf, isnan, log
+from operator import truediv
+
+from acceleration import partialsums, transforms
+from bitsize import BitGrowthWarning, bitlength, bits, checkgrowth
 
 
 class DivergenceError(ArithmeticError): pass
 
 
+def _split(ratios, lo, hi):
+    # Binary splitting of the sum over n from lo to hi - 1 of the products
+    # of ratios[k] for k from lo to n - 1, where each ratio is a pair of
+    # integers (p, q); returns integers (P, Q, T) where P / Q is the product
+    # of all the ratios in the range and T / Q is the sum
+    if hi - lo == 1:
+        p, q = ratios[lo]
+        return (p, q, q)
+    mid = (lo + hi) // 2
+    P1, Q1, T1 = _split(ratios, lo, mid)
+    P2, Q2, T2 = _split(ratios, mid, hi)
+    return (P1 * P2, Q1 * Q2, T1 * Q2 + P1 * T2)
+
+
+def _ratio(x, r):
+    # An upper bound for x / r less than 1; if it has a large denominator
+    # it is rounded up to a multiple of 2^-32 when possible, so that powers
+    # of it stay small
+    q = x / r
+    if q.denominator <= 2 ** 32:
+        return q
+    up = Fraction(-((-q.numerator * 2 ** 32) // q.denominator), 2 ** 32)
+    return up if up < 1 else q
+
+
+def _log(v):
+    # Natural log of a positive fraction, which may be too large or too
+    # small for a float
+    return log(v.numerator) - log(v.denominator)
+
+
+def _tailterms(M, q, error):
+    # Return (n, tail), where n is the number of terms after which the
+    # tail bound M q^n / (1 - q) is within error, and tail is that bound;
+    # n is estimated with logarithms, then checked exactly
+    tail = M / (1 - q)
+    if tail <= error:
+        return (0, tail)
+    if q == 0:
+        return (1, Fraction(0, 1))
+    n = max(int((_log(error) - _log(tail)) / _log(q)), 0)
+    while tail * q ** n > error:
+        n += 1
+    return (n, tail * q ** n)
+
+
+# Argument reduction strategies for the example series, keyed by the
+# ``funcname`` field of the series; each takes the PowerFunction, the
+# argument, and the relative error, and returns the function value. The
+# reduced arguments are evaluated with the hypergeometric versions of the
+# series by binary splitting, which bounds the truncation error rigorously
+
+def _round(v, precision):
+    # Round v to a fraction with a power of 2 denominator, keeping about
+    # precision significant bits, so repeated squarings and products
+    # don't make the denominators grow without limit
+    return _roundquotient(v.numerator, v.denominator, precision)
+
+
+def _roundquotient(num, den, precision):
+    # Round the quotient of the integers num and den as above, without
+    # reducing it to lowest terms first
+    if num == 0:
+        return Fraction(0, 1)
+    if den < 0:
+        num, den = -num, -den
+    shift = precision - bitlength(num) + bitlength(den)
+    if shift <= 0:
+        return Fraction(num // den, 1)
+    scale = 2 ** shift
+    return Fraction((2 * num * scale + den) // (2 * den), scale)
+
+
+def _precision(error, extra=0):
+    # Bits of precision needed for a relative error, plus extra guard bits
+    return bitlength(int(1 / error)) + extra + 8
+
+
+def _pi(error):
+    # Machin's formula, pi = 16 arctan(1/5) - 4 arctan(1/239), with each
+    # arctangent summed by binary splitting to absolute error error / 32
+    return (16 * _evaluate('arctan', Fraction(1, 5), error / 32) -
+            4 * _evaluate('arctan', Fraction(1, 239), error / 32))
+
+
+def _evaluate(funcname, x, error):
+    # Evaluate the named example series on x to absolute error error,
+    # rounded to the corresponding precision
+    import powerseries
+    series = getattr(powerseries, '%sseries' % funcname)(fast=True)
+    num, den = PowerFunction(series)._splitsum(x, None, error)
+    return _roundquotient(num, den, _precision(error))
+
+
+def _reduceexp(pf, x, error):
+    # exp(x) = exp(x / 2^h)^(2^h), with |x| / 2^h <= 1/2; each squaring
+    # doubles the relative error, so the reduced argument is evaluated
+    # with h more bits
+    h = 0
+    while abs(x) > Fraction(1, 2):
+        x /= 2
+        h += 1
+    precision = _precision(error, h)
+    result = _round(_evaluate('exp', x, Fraction(1, 2 ** precision)), precision)
+    for i in xrange(h):
+        result = _round(result * result, precision)
+    return result
+
+
+def _reducetrig(pf, x, error):
+    # Reduce modulo 2 pi, then halve until |x| <= 1/4 and use the double
+    # angle formulas sin 2x = 2 sin x cos x, cos 2x = cos^2 x - sin^2 x;
+    # the result is sin, cos or tan according to the series funcname
+    funcname = pf.series.funcname
+    precision = _precision(error, bitlength(int(abs(x))) + 8)
+    eps = Fraction(1, 2 ** precision)
+    if abs(x) > 3:
+        pi = _round(_pi(eps), precision)
+        x -= 2 * pi * int((x / (2 * pi)) + Fraction(1, 2) * (1 if x > 0 else -1))
+    h = 0
+    while abs(x) > Fraction(1, 4):
+        x /= 2
+        h += 1
+    s = _round(_evaluate('sin', x, eps), precision)
+    c = _round(_evaluate('cos', x, eps), precision)
+    for i in xrange(h):
+        s, c = _round(2 * s * c, precision), _round(c * c - s * s, precision)
+    if funcname == 'sin':
+        return s
+    if funcname == 'cos':
+        return c
+    return s / c
+
+
+def _reducearctan(pf, x, error):
+    # arctan x = pi/2 - arctan(1/x) for x > 1, and the addition formula
+    # arctan x = pi/4 + arctan((x - 1) / (x + 1)) for 2/5 < x <= 1, so the
+    # reduced argument is at most 3/7 in magnitude; arctan is odd
+    if x < 0:
+        return - _reducearctan(pf, -x, error)
+    precision = _precision(error, 4)
+    eps = Fraction(1, 2 ** precision)
+    pi = _round(_pi(eps), precision)
+    offset = Fraction(0, 1)
+    sign = 1
+    if x > 1:
+        offset, sign, x = pi / 2, -1, 1 / x
+    if x > Fraction(2, 5):
+        offset += sign * pi / 4
+        x = (x - 1) / (x + 1)
+    return _round(offset + sign * _evaluate('arctan', x, eps), precision)
+
+
+_reductions = dict(exp=_reduceexp, sin=_reducetrig, cos=_reducetrig, tan=_reducetrig,
+                   arctan=_reducearctan)
+
+
+def _powers(series, x, terms):
+    # Generate the index, the term, and the power of x for each term of
+    # series below index terms that is not known to be zero, using the
+    # valuation and step fields of a PowerSeries (other iterables have
+    # no known zero terms), so no powers are computed for the zero terms
+    v = getattr(series, 'valuation', 0)
+    s = getattr(series, 'step', 1)
+    xt = x ** v
+    if s:
+        xs = x if s == 1 else x ** s
+        for n, t in enumerate(islice(series, v, terms, s)):
+            yield v + n * s, t, xt
+            xt *= xs
+    elif v < terms:
+        for t in islice(series, v, v + 1):
+            yield v, t, xt
+
+
 class PowerFunction(object):
     """Wrap a power series and compute its function.
     
@@ -106,21 +287,77 @@ class PowerFunction(object):
     Note that, although this class was written to work with the
     ``PowerSeries`` class, it can actually work with any iterable
     that yields terms of a series.
+    
+    If the ``profile`` field is set to ``True``, each computation
+    records the bit sizes (see ``bitsize.py``) of the terms, the
+    powers of x, and the partial sums in the ``sizes`` field, and
+    issues a ``BitGrowthWarning`` if the sizes of the powers or the
+    partial sums grow abnormally fast, or if a floating point
+    argument has to be converted to a fraction with a large
+    denominator (which makes every later computation expensive):
+    
+    >>> from powerseries import expseries
+    >>> f = PowerFunction(expseries())
+    >>> f.profile = True
+    >>> print f(Fraction(1, 2))
+    75973/46080
+    >>> f.sizes['powers']
+    [(1, 1), (1, 2), (1, 3), (1, 4), (1, 5), (1, 6), (1, 7)]
+    >>> f.sizes['sums']
+    [(1, 1), (2, 2), (4, 4), (7, 6), (8, 8), (13, 12), (17, 16)]
+    >>> warnings.simplefilter('error', BitGrowthWarning)
+    >>> f(0.1, exact=True)
+    Traceback (most recent call last):
+    ...
+    BitGrowthWarning: Argument 0.1 converted to a fraction with a 56-bit denominator.
+    >>> warnings.resetwarnings()
+    
+    The ``centers`` argument gives points other than 0 to expand the
+    series about (see ``PowerSeries.shift_center``; each expansion is
+    computed from ``center_order`` terms of the series), and more can
+    be added with ``addcenter``. The function is then computed from the
+    expansion about the center nearest to x, which converges faster, and
+    can converge where the series itself does not:
+    
+    >>> from math import atan
+    >>> from powerseries import arctanseries
+    >>> f = PowerFunction(arctanseries(fast=True))
+    >>> f(Fraction(11, 10))
+    Traceback (most recent call last):
+    ...
+    DivergenceError: Series failed ratio test.
+    >>> f.addcenter(Fraction(1, 2))
+    >>> abs(float(f(Fraction(11, 10), figures=6)) - atan(1.1)) < 1e-6
+    True
     """
     
     error = Fraction(1, 10000)
     error_terms = 1
     terms_max = 50
     ratio_max = 5
+    profile = False
+    center_order = 200
     
-    def __init__(self, series):
+    def __init__(self, series, centers=()):
         self.__series = series
+        self.__centers = {}
+        # Float coefficients and the iterator they are pulled from, by center
+        self.__floats = {}
+        for c in centers:
+            self.addcenter(c)
     
     @property
     def series(self):
         return self.__series
     
-    def __call__(self, x, terms=None, error=None, figures=None):
+    def addcenter(self, c):
+        """Add an expansion of the series about the point ``c``.
+        """
+        c = self._fraction(c)
+        if c and (c not in self.__centers):
+            self.__centers[c] = self.__series.shift_center(c, self.center_order)
+    
+    def __call__(self, x, terms=None, error=None, figures=None, reduce=False, exact=None):
         """Compute the function of this power series on x.
         
         The ``terms`` argument controls how many terms of the series
@@ -142,13 +379,86 @@ class PowerFunction(object):
         and their sum returned, regardless of convergence. However,
         if an overflow occurs before the requested number of terms
         is computed, ``DivergenceError`` is raised.
+        
+        If ``reduce`` is true and ``terms`` is not given, and the series
+        is one of the example series in ``powerseries.py`` with an argument
+        reduction strategy (exp, sin, cos, tan and arctan; the ``funcname``
+        field of the series names it), the argument is first reduced, using
+        halving and squaring for exp, reduction modulo 2 pi and the double
+        angle formulas for sin, cos and tan, and the complementary angle and
+        addition formulas for arctan, so the series is summed at a small
+        argument where it converges quickly. Intermediate results are rounded
+        to the precision needed for the requested error, so the result is
+        a fraction with a power of 2 denominator rather than a partial sum:
+        
+        >>> from math import exp, sin, atan
+        >>> from powerseries import expseries, sinseries, arctanseries
+        >>> f = PowerFunction(expseries())
+        >>> f(50)
+        Traceback (most recent call last):
+        ...
+        DivergenceError: Series failed ratio test.
+        >>> abs(float(f(50, reduce=True)) / exp(50) - 1) < 1e-4
+        True
+        >>> abs(float(f(50, reduce=True, error=1e-10)) / exp(50) - 1) < 1e-9
+        True
+        >>> f = PowerFunction(sinseries())
+        >>> abs(float(f(100, reduce=True, figures=12)) - sin(100)) < 1e-12
+        True
+        >>> f = PowerFunction(arctanseries())
+        >>> abs(float(f(Fraction(99, 100), reduce=True, figures=12)) - atan(0.99)) < 1e-12
+        True
+        
+        If ``exact`` is false, or if it is ``None`` (the default) and x is a
+        float, the sum is computed in floating point: the terms of the series
+        are converted to floats once, the first time they are needed, and
+        cached, and the sum uses Neumaier's compensated summation, so there
+        is no rounding error to speak of beyond that of the terms themselves.
+        Convergence and divergence are tested as for exact sums; a term that
+        overflows to infinity raises ``DivergenceError``:
+        
+        >>> f = PowerFunction(expseries())
+        >>> v = f(0.5, figures=12)
+        >>> type(v), abs(v - exp(0.5)) < 1e-12
+        (<type 'float'>, True)
+        >>> f(Fraction(1, 2), figures=12) == f(0.5, figures=12, exact=True)
+        True
+        >>> f(1e200, terms=3)
+        Traceback (most recent call last):
+        ...
+        DivergenceError: Series diverged to overflow point.
+        
+        The terms known to be zero (see the ``valuation`` and ``step``
+        fields of ``PowerSeries``) are skipped in both cases, so an odd
+        or even series costs half as many terms:
+        
+        >>> f = PowerFunction(sinseries())
+        >>> abs(f(0.5, figures=12) - sin(0.5)) < 1e-12
+        True
+        >>> len(f._PowerFunction__floats[0][0])
+        7
         """
-        if isinstance(x, (int, long)):
-            x = Fraction(x, 1)
-        elif isinstance(x, float):
-            x = Fraction.from_float(x)
-        if not isinstance(x, Fraction):
-            raise ValueError("Power series function requires fraction as argument.")
+        if reduce and (terms is None):
+            strategy = _reductions.get(getattr(self.__series, 'funcname', None))
+            if strategy is not None:
+                if figures is not None:
+                    error = Fraction(1, 10**figures)
+                elif error is None:
+                    error = self.error
+                return strategy(self, self._fraction(x), self._fraction(abs(error)))
+        if exact is None:
+            exact = not isinstance(x, float)
+        if self.profile and exact:
+            sizes = self.sizes = dict(terms=[], powers=[], sums=[])
+        else:
+            sizes = None
+        x = self._fraction(x, sizes is not None) if exact else float(x)
+        series, center = self.__series, 0
+        if self.__centers:
+            c = min(self.__centers, key=lambda c: abs(x - c))
+            if abs(x - c) < abs(x):
+                series, center = self.__centers[c], c
+                x -= c
         if terms is None:
             terms = self.terms_max
         if figures is not None:
@@ -156,21 +466,296 @@ class PowerFunction(object):
         elif error is None:
             error = self.error
         error = abs(error)
-        result = Fraction(0, 1)
         self._clear_testfields()
-        xt = Fraction(1, 1)
-        for n, t in enumerate(islice(self.__series, terms)):
+        if not exact:
+            return self._floatsum(series, center, x, terms, float(error))
+        result = Fraction(0, 1)
+        for n, t, xt in _powers(series, x, terms):
             try:
                 term = t * xt
                 result += term
             except OverflowError:
                 raise DivergenceError("Series diverged to overflow point.")
+            if sizes is not None:
+                sizes['terms'].append(bits(term))
+                sizes['powers'].append(bits(xt))
+                sizes['sums'].append(bits(result))
             # This will raise DivergenceError if necessary
             if self.converged(x, n, term, result, error):
                 break
-            xt *= x
+        if sizes is not None:
+            checkgrowth(sizes['powers'], "powers of x")
+            checkgrowth(sizes['sums'], "partial sums")
         return result
     
+    def accelerate(self, x, method='levin', terms=None, error=None, figures=None):
+        """Compute the function on x with a sequence acceleration transform.
+        
+        Returns a tuple of the accelerated value and an estimate of its
+        error, the difference between the last two transformed values.
+        The ``method`` is the name of a transform in ``acceleration.py``:
+        ``euler`` (for alternating series), ``aitken``, ``wynn`` or ``levin``.
+        The transform is applied to the nonzero terms of the series at x and
+        their partial sums, after each nonzero term, until the error estimate
+        is less than the requested error (given as for ``__call__``) relative
+        to the value, or until ``terms`` terms of the series (by default,
+        ``terms_max``) have been used; in the latter case the caller should
+        check the error estimate. As with ``__call__``, x can be a float,
+        and the computation is then done in floating point.
+        
+        The alternating harmonic series at x = 1, and the arctangent series
+        at x = 1, whose partial sums have only about two significant figures
+        after the 50 terms that ``__call__`` allows by default, converge to
+        twelve with a few dozen:
+        
+        >>> from math import log, pi
+        >>> from powerseries import altharmonicseries, arctanseries
+        >>> f = PowerFunction(altharmonicseries())
+        >>> value, estimate = f.accelerate(Fraction(1, 1), figures=12)
+        >>> abs(float(value) - log(2)) < 1e-12, estimate < 1e-12
+        (True, True)
+        >>> f = PowerFunction(arctanseries())
+        >>> value, estimate = f.accelerate(1.0, method='wynn', figures=12)
+        >>> abs(value - pi / 4) < 1e-12
+        True
+        """
+        transform = transforms[method]
+        if not isinstance(x, float):
+            x = self._fraction(x)
+        if terms is None:
+            terms = self.terms_max
+        if figures is not None:
+            error = Fraction(1, 10**figures)
+        elif error is None:
+            error = self.error
+        error = abs(error)
+        nonzero = []
+        value, estimate = x * 0, None
+        xt = x ** 0
+        for t in islice(self.__series, terms):
+            if t:
+                nonzero.append(t * xt)
+                last, value = value, transform(nonzero, partialsums(nonzero))
+                if len(nonzero) > 1:
+                    estimate = abs(value - last)
+                    if estimate < abs(error * value):
+                        break
+            xt *= x
+        if estimate is None:
+            # With at most one nonzero term we have nothing to compare
+            estimate = abs(value)
+        return value, estimate
+    
+    def _floatsum(self, series, center, x, terms, error):
+        # Internal method to sum the series in floating point, with
+        # Neumaier's compensated summation; comp accumulates the low
+        # order bits lost in each addition. As in _powers, the terms
+        # known to be zero are skipped, so only the others are cached
+        v = getattr(series, 'valuation', 0)
+        s = getattr(series, 'step', 1)
+        if center not in self.__floats:
+            it = islice(series, v, None, s) if s else islice(series, v, v + 1)
+            self.__floats[center] = ([], it)
+        coeffs, it = self.__floats[center]
+        if v >= terms:
+            return 0.0
+        num = (terms - v + s - 1) // s if s else 1
+        result = comp = 0.0
+        try:
+            xt, xs = x ** v, x ** s
+        except OverflowError:
+            raise DivergenceError("Series diverged to overflow point.")
+        for k in xrange(num):
+            n = v + k * s
+            if k == len(coeffs):
+                t = next(it, None)
+                if t is None:
+                    break
+                try:
+                    coeffs.append(float(t))
+                except OverflowError:
+                    raise DivergenceError("Series diverged to overflow point.")
+            term = coeffs[k] * xt
+            if isinf(term) or isnan(term):
+                raise DivergenceError("Series diverged to overflow point.")
+            s = result + term
+            if abs(result) >= abs(term):
+                comp += (result - s) + term
+            else:
+                comp += (term - s) + result
+            result = s
+            # This will raise DivergenceError if necessary
+            if self.converged(x, n, term, result + comp, error):
+                break
+            xt *= xs
+        return result + comp
+    
+    def _fraction(self, x, check=False):
+        # Internal method to convert the argument x to a fraction; if check
+        # is true, warn if a float converts to a large denominator
+        if isinstance(x, (int, long)):
+            x = Fraction(x, 1)
+        elif isinstance(x, float):
+            arg, x = x, Fraction.from_float(x)
+            if check and (bits(x)[1] > 32):
+                warnings.warn("Argument %r converted to a fraction with a %d-bit denominator."
+                              % (arg, bits(x)[1]), BitGrowthWarning, stacklevel=3)
+        if not isinstance(x, Fraction):
+            raise ValueError("Power series function requires fraction as argument.")
+        return x
+    
+    def enclose(self, x, error=None, figures=None, bound=None):
+        """Compute the function of this power series on x with a guaranteed error.
+        
+        Returns a tuple ``(value, radius)`` such that the exact value of
+        the function on x is within ``radius`` of ``value``. The terms are
+        summed in exact rational arithmetic, so the only error is that of
+        truncating the series, and it is bounded using a bound on the
+        coefficients: if |a(n)| r^n <= M for all n, with r > |x|, then
+        with q = |x| / r the terms from index n on sum to at most
+        M q^n / (1 - q). Terms are added until that bound is within
+        ``error``, so no more terms are computed than the requested
+        accuracy needs.
+        
+        The ``bound`` argument is either a tuple ``(M, r)`` or a function
+        that takes |x| and returns such a tuple (or ``None`` if it has no
+        bound for that argument); it defaults to the ``cauchybound`` field
+        of the series, which the example series in ``powerseries.py`` have.
+        Note that ``error`` here is absolute, not relative to the result;
+        ``figures`` is converted to an error of 1 / 10^figures as usual.
+        ``DivergenceError`` is raised if there is no bound for x.
+        
+        >>> from math import exp, tan
+        >>> from powerseries import expseries, tanseries, nthpower
+        >>> value, radius = PowerFunction(expseries()).enclose(Fraction(1, 2), figures=12)
+        >>> radius < Fraction(1, 10 ** 12)
+        True
+        >>> abs(value - Fraction.from_float(exp(0.5))) < radius + Fraction(1, 10 ** 15)
+        True
+        >>> value, radius = PowerFunction(tanseries()).enclose(Fraction(1, 1))
+        >>> abs(value - Fraction.from_float(tan(1.0))) < radius
+        True
+        >>> PowerFunction(tanseries()).enclose(Fraction(2, 1))
+        Traceback (most recent call last):
+        ...
+        DivergenceError: No coefficient bound for argument 2.
+        >>> PowerFunction(nthpower(2)).enclose(Fraction(1, 3), bound=(1, 1))
+        (Fraction(1, 9), Fraction(1, 13122))
+        
+        The error can be a float too:
+        
+        >>> value, radius = PowerFunction(expseries()).enclose(Fraction(1, 2), error=1e-10)
+        >>> radius < 1e-10
+        True
+        """
+        x = self._fraction(x)
+        if bound is None:
+            bound = getattr(self.__series, 'cauchybound', None)
+        if callable(bound):
+            bound = bound(abs(x))
+        if (bound is None) or (abs(x) >= bound[1]):
+            raise DivergenceError("No coefficient bound for argument %s." % x)
+        M, r = Fraction(bound[0]), Fraction(bound[1])
+        if figures is not None:
+            error = Fraction(1, 10**figures)
+        elif error is None:
+            error = self.error
+        error = self._fraction(abs(error))
+        terms, tail = _tailterms(M, _ratio(abs(x), r), error)
+        result = Fraction(0, 1)
+        for n, t, xt in _powers(self.__series, x, terms):
+            result += t * xt
+        return (result, tail)
+    
+    def binarysplit(self, x, terms=None, error=None, figures=None):
+        """Compute the function of a hypergeometric series on x by binary splitting.
+        
+        The series must have a ``hyperparams`` field (see the ``hypergeometric``
+        function in ``powerseries.py``), so that the ratio of each term to
+        the previous one is a known rational function of the index. Instead
+        of adding terms one at a time, which makes the partial sum carry
+        an ever larger denominator through every addition, the products of
+        the ratios and the partial sums over ranges of indexes are combined
+        in a balanced tree of integer products, which costs only a little
+        more than linear time in the number of digits of the result.
+        
+        The ``terms`` argument gives the number of terms of the series to
+        sum; the result is exactly the sum of those terms. If it is not
+        given, the number of terms is chosen as by ``enclose`` if the series
+        has a ``cauchybound`` field (so ``error`` is absolute and guaranteed);
+        otherwise terms are counted, using floating point estimates of their
+        size, until one is smaller than ``error`` times the estimated sum,
+        with ``terms_max`` as a limit.
+        
+        >>> from powerseries import expseries, arctanseries
+        >>> f = PowerFunction(arctanseries(fast=True))
+        >>> x = Fraction(1, 5)
+        >>> f.binarysplit(x, terms=30) == sum(t * x ** n for n, t in enumerate(islice(f.series, 30)))
+        True
+        >>> f.binarysplit(Fraction(1, 5), figures=50) == f.enclose(Fraction(1, 5), figures=50)[0]
+        True
+        >>> f = PowerFunction(expseries(fast=True))
+        >>> print f.binarysplit(Fraction(1, 1))
+        9864101/3628800
+        >>> f.binarysplit(Fraction(1, 2), error=1e-10) == f.enclose(Fraction(1, 2), error=1e-10)[0]
+        True
+        """
+        if figures is not None:
+            error = Fraction(1, 10**figures)
+        elif error is None:
+            error = self.error
+        num, den = self._splitsum(self._fraction(x), terms, self._fraction(abs(error)))
+        return Fraction(num, den)
+    
+    def _splitsum(self, x, terms, error):
+        # Internal method for binary splitting; returns the sum as a pair
+        # of integers (numerator, denominator), not reduced to lowest terms
+        params = getattr(self.__series, 'hyperparams', None)
+        if params is None:
+            raise ValueError("Binary splitting requires a hypergeometric series.")
+        a, b, z, power, shift = params
+        w = z * x ** power
+        bound = getattr(self.__series, 'cauchybound', None)
+        if callable(bound):
+            bound = bound(abs(x))
+        if (terms is None) and (bound is not None) and (abs(x) < bound[1]):
+            M, r = Fraction(bound[0]), Fraction(bound[1])
+            terms = _tailterms(M, _ratio(abs(x), r), error)[0]
+        # Ratios of each hypergeometric term to the previous one, as pairs
+        # of integers; they are not reduced to lowest terms, since with a
+        # large denominator for x that would cost more than the splitting
+        ratios = []
+        def ratio(n):
+            p, q = w.numerator, w.denominator * (n + 1)
+            for c in a:
+                p *= c.numerator + n * c.denominator
+                q *= c.denominator
+            for c in b:
+                p *= c.denominator
+                q *= c.numerator + n * c.denominator
+            return (p, q)
+        if terms is not None:
+            count = max((terms - shift + power - 1) // power, 0)
+            ratios = [ratio(n) for n in xrange(count)]
+        else:
+            # Estimate term sizes in floating point
+            size = total = 1.0
+            limit = max((self.terms_max - shift + power - 1) // power, 1)
+            while len(ratios) < limit:
+                p, q = ratio(len(ratios))
+                ratios.append((p, q))
+                r = abs(truediv(p, q))
+                size *= r
+                total += size
+                if (p == 0) or ((r < 1) and (size < float(error) * abs(total))):
+                    break
+            count = len(ratios)
+        if count == 0:
+            return (0, 1)
+        P, Q, T = _split(ratios, 0, count)
+        xs = x ** shift
+        return (T * xs.numerator, Q * xs.denominator)
+    
     def _clear_testfields(self):
         # Internal method to clear convergence testing fields
         self.__terms_last = deque(maxlen=self.error_terms)
@@ -207,9 +792,11 @@ class PowerFunction(object):
         that value. For example, computing the tangent of pi will
         diverge, even though the proper analytical value of tan(pi)
         is 0, because computing that would require us to expand the
-        series around x = pi. This is not seen as an issue because
-        the calling code can always apply an offset to x before
-        invoking the series function.
+        series around x = pi. The calling code can apply an offset to
+        x before invoking the series function, or add an expansion
+        about another center (see ``addcenter``); note that the terms
+        of such an expansion often vary irregularly in size, so the
+        ratio test may fail for them when a high precision is asked for.
         """
         if term != 0:
             self.__terms_last.append(term)
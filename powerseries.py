@@ -132,12 +132,189 @@ gives back itself (and similarly for other series).
     
 """
 
-from fractions import Fraction
-from itertools import count, islice, izip, izip_longest
+import sys
+import warnings
+from fractions import Fraction, gcd
+from functools import wraps
+from itertools import count, islice, izip
+from weakref import WeakValueDictionary
+
+from bitsize import BitGrowthWarning, bits, checkgrowth
 
 from cached_class import cached_class
 from cached_property import cached_property
 from memoize_generator import memoize_generator
+from MemoizedGenerator import MemoizedGenerator
+
+
+# All live series, by id, for the global reports below; the values are
+# weak references so this does not keep any series alive by itself
+
+_registry = WeakValueDictionary()
+
+# The arenas that are active, innermost last; see ``SeriesArena`` below
+
+_arenas = []
+
+
+def _released():
+    # The generator of a series that has been released
+    raise ValueError("PowerSeries has been released.")
+    yield
+
+
+def _arena():
+    # Return the arena that a series being constructed belongs to, if any:
+    # a series constructed while the generator of another series computes
+    # a term is part of that series' definition, so it belongs to the
+    # arena that series belongs to (none, if it was constructed outside
+    # every arena); otherwise it belongs to the innermost arena
+    f = sys._getframe(2)
+    while f is not None:
+        if f.f_code is _gencode:
+            owner = id(f.f_locals['self'])
+            for arena in reversed(_arenas):
+                if owner in arena.series:
+                    return arena
+            return None
+        f = f.f_back
+    return _arenas[-1]
+
+
+def _sizeof(obj, seen):
+    # Return the size in bytes of obj, including the numerator and
+    # denominator if it is a Fraction, not counting objects whose ids
+    # are in seen, and adding the ids of the objects counted to seen
+    result = 0
+    objs = (obj, obj.numerator, obj.denominator) if isinstance(obj, Fraction) else (obj,)
+    for o in objs:
+        if id(o) not in seen:
+            seen.add(id(o))
+            result += sys.getsizeof(o)
+    return result
+
+
+# Fusion of chains of linear operations; see the ``fused`` method below.
+# A linear form represents the series whose nth term is consts[n] (zero if
+# n is not a key) plus, for each component (coeff, ks, base, shift, lo, hi)
+# with lo <= n < hi (hi None meaning no upper limit), the term of index
+# n + shift of base, times coeff, divided by (n + k) for each k in ks
+
+def _linearform(S):
+    # Return the linear form of S as a tuple (consts, comps), expanding
+    # the linear operations recorded in the ``linear`` fields of the
+    # series S is built from, down to series built some other way
+    op = S.linear
+    if op is None:
+        return {}, [(Fraction(1, 1), (), S, 0, 0, None)]
+    if op[0] == 'monomial':
+        return {op[1]: op[2]}, []
+    if op[0] == 'add':
+        consts, comps = _linearform(op[1])
+        other, ocomps = _linearform(op[2])
+        consts = dict(consts)
+        for n, c in other.iteritems():
+            consts[n] = consts.get(n, 0) + c
+        return consts, _mergecomps(comps + ocomps)
+    consts, comps = _linearform(op[1])
+    if op[0] == 'scale':
+        c = op[2]
+        return (dict((n, c * t) for n, t in consts.iteritems()),
+                [(c * comp[0],) + comp[1:] for comp in comps])
+    if op[0] == 'head':
+        return (dict((n, t) for n, t in consts.iteritems() if n == 0),
+                [comp[:5] + (1,) for comp in comps
+                 if comp[4] == 0 and (comp[5] is None or comp[5] > 0)])
+    if op[0] == 'tail':
+        result = []
+        for coeff, ks, base, shift, lo, hi in comps:
+            if hi is None or hi > 1:
+                result.append((coeff, tuple(k + 1 for k in ks), base, shift + 1,
+                               max(lo - 1, 0), hi and hi - 1))
+        return dict((n - 1, t) for n, t in consts.iteritems() if n > 0), result
+    # xmul and integral both move every term up one place
+    result = [(coeff, tuple(k - 1 for k in ks), base, shift - 1, lo + 1, hi and hi + 1)
+              for coeff, ks, base, shift, lo, hi in comps]
+    if op[0] == 'xmul':
+        return dict((n + 1, t) for n, t in consts.iteritems()), result
+    result = [(comp[0], comp[1] + (0,)) + comp[2:] for comp in result]
+    consts = dict((n + 1, Fraction(1, n + 1) * t) for n, t in consts.iteritems())
+    consts[0] = op[2]
+    return consts, result
+
+
+def _mergecomps(comps):
+    # Combine the coefficients of components that differ only in them
+    coeffs, order = {}, []
+    for comp in comps:
+        key = (comp[1], id(comp[2])) + comp[3:]
+        if key not in coeffs:
+            order.append((key, comp))
+            coeffs[key] = comp[0]
+        else:
+            coeffs[key] += comp[0]
+    return [(coeffs[key],) + comp[1:] for key, comp in order if coeffs[key]]
+
+
+# Compiled generator factories, by source; the source depends only on the
+# shape of the linear form, so there are only a few of them
+_fusedcode = {}
+
+
+def _fusedgenerator(consts, comps):
+    # Return a generator function for the linear form (consts, comps),
+    # compiled from Python source; the range of indexes is split at the
+    # points where components start or stop, and at the constants, and
+    # each piece is a loop that yields the sum of the components active
+    # in it, so there are no tests and no additions of zero per term.
+    # The coefficients and the iterators over the bases are locals
+    consts = dict((n, t) for n, t in consts.iteritems() if t)
+    comps = [comp for comp in comps if comp[0]]
+    lines = ["def _factory(consts, coeffs, bases):",
+             "    def _fused():"]
+    if comps:
+        lines.append("        %s, = coeffs" % ", ".join("c%d" % i for i in xrange(len(comps))))
+        lines.append("        %s, = [islice(base, lo + shift, hi and hi + shift)"
+                     " for base, shift, lo, hi in bases]" % ", ".join("i%d" % i for i in xrange(len(comps))))
+    exprs = []
+    for i, (coeff, ks, base, shift, lo, hi) in enumerate(comps):
+        expr = "next(i%d)" % i if coeff == 1 else "c%d * next(i%d)" % (i, i)
+        if ks:
+            expr = "Fraction(1, %s) * %s" % (" * ".join("(n + %d)" % k if k else "n" for k in ks), expr)
+        exprs.append(expr)
+    points = set([0])
+    for coeff, ks, base, shift, lo, hi in comps:
+        points.add(lo)
+        if hi is not None:
+            points.add(hi)
+    for n in consts:
+        points.update((n, n + 1))
+    points = sorted(points)
+    infinite = any(comp[5] is None for comp in comps)
+    for j, start in enumerate(points):
+        if j + 1 < len(points):
+            lines.append("        for n in xrange(%d, %d):" % (start, points[j + 1]))
+        elif infinite:
+            lines.append("        for n in count(%d):" % start)
+        else:
+            break
+        terms = ["consts[%d]" % start] if start in consts else []
+        terms.extend(expr for expr, (coeff, ks, base, shift, lo, hi) in zip(exprs, comps)
+                     if lo <= start and (hi is None or start < hi))
+        lines.append("            yield %s" % (" + ".join(terms) or "_zero"))
+    if len(lines) == 2:
+        lines.append("        return")
+        lines.append("        yield")
+    lines.append("    return _fused")
+    source = "\n".join(lines)
+    try:
+        factory = _fusedcode[source]
+    except KeyError:
+        namespace = dict(islice=islice, count=count, Fraction=Fraction, _zero=Fraction(0, 1))
+        exec compile(source, "<fused>", "exec") in namespace
+        factory = _fusedcode[source] = namespace['_factory']
+    return factory(consts, [comp[0] for comp in comps],
+                   [(comp[2], comp[3], comp[4], comp[5]) for comp in comps])
 
 
 @cached_class
@@ -155,10 +332,42 @@ class PowerSeries(object):
     of arguments). This reduces object churn, particularly for series
     that are commonly used, such as the empty series, and thus helps
     to speed computations.
+    
+    Each series has a ``name``, used only to label it in reports; it
+    defaults to the name of the generator or term function the series
+    was constructed from, with any leading underscores removed, so the
+    results of operations are labeled by their kind (e.g., ``m`` for
+    a product, ``a`` for a sum, ``i`` for an integral).
     """
     
     testlimit = 10
     
+    # The largest number of memoized terms that the term-local operations
+    # take from an operand at once; see ``block``
+    blocksize = 64
+    
+    # Metadata about particular series, set by the functions that construct
+    # them; see the docstrings of those functions
+    hyperparams = None
+    cauchybound = None
+    funcname = None
+    
+    # The linear operation this series was constructed by, if any, as a
+    # tuple of the operation name and its arguments; see ``fused``
+    linear = None
+    
+    # Known zero terms: every term of index below ``valuation`` is zero,
+    # and so is every term whose index differs from the valuation by
+    # something other than a multiple of ``step`` (a step of 0 means only
+    # the term at the valuation can be nonzero). The defaults claim
+    # nothing; the operations below set them when they can tell, and
+    # products and compositions use them to skip known zero terms
+    valuation = 0
+    step = 1
+    
+    # The point the series is expanded about; see ``shift_center``
+    center = Fraction(0, 1)
+    
     def __init__(self, g=None, f=None, l=None):
         """Construct a PowerSeries from a generator, term function, or list.
         
@@ -172,28 +381,51 @@ class PowerSeries(object):
         order; internally, a generator is constructed that yields the terms.
         
         If none of ``f``, ``g``, ``l`` is present, the series will be empty.
+        
+        Any callable will do for ``g`` or ``f``; the series is named after
+        it (see the class docstring), or after its type if it has no name:
+        
+        >>> from functools import partial
+        >>> PowerSeries(f=partial(pow, Fraction(1, 2))).name
+        'partial'
         """
         if g:
             self.__g = g
+            self.name = getattr(g, '__name__', type(g).__name__).lstrip('_')
         elif f:
             def _g():
                 for n in count():
                     yield f(n)
             self.__g = _g
+            self.name = getattr(f, '__name__', type(f).__name__).lstrip('_')
         elif l:
             def _l():
                 for t in l:
                     yield t
             self.__g = _l
+            self.name = 'list'
         else:
             # Empty series
             self.__g = None
+            self.name = 'empty'
         # Internal fields for storing cached results of operations
-        self.__D = self.__E = self.__R = self.__I = self.__S = self.__L = None
+        self.__D = self.__E = self.__R = self.__I = self.__S = self.__L = self.__F = None
         self.__As = {}
         self.__Ms = {}
         self.__Cs = {}
         self.__Is = {}
+        self.__Ts = {}
+        self.__Fs = {}
+        self.__memo = None
+        # Number of operations constructed that read our terms; see _read
+        self.__readers = 0
+        # Number of times each operation cache above returned a result
+        self.__hits = dict.fromkeys(('add', 'mul', 'compose', 'integral', 'shift'), 0)
+        _registry[id(self)] = self
+        if _arenas:
+            arena = _arena()
+            if arena is not None:
+                arena.series[id(self)] = self
     
     @memoize_generator
     def _gen(self):
@@ -232,6 +464,376 @@ class PowerSeries(object):
         """
         return self._gen()
     
+    @property
+    def _memo(self):
+        # The MemoizedGenerator instance behind our generator
+        return self._gen.im_func
+    
+    def block(self, start, size):
+        """Return a list of the ``size`` terms from index ``start`` on.
+        
+        The terms are taken from, and computed into, the same memo as the
+        terms yielded by iteration, but with one call instead of a generator
+        resume per term:
+        
+        >>> E = expseries()
+        >>> E.block(3, 3)
+        [Fraction(1, 6), Fraction(1, 24), Fraction(1, 120)]
+        >>> E.block(0, 2) == list(islice(E, 2))
+        True
+        """
+        return self.__memoized().block(start, start + size)
+    
+    def __memoized(self):
+        # Return our generator's memo, realizing the generator first if
+        # needed so the memo has something to advance
+        memo = self.__memo
+        if memo is None:
+            self._gen()
+            memo = self.__memo = self._memo
+        return memo
+    
+    def _block(self, start, size=None):
+        # Return a list of the terms from index start on that are already
+        # memoized, up to size of them (by default, blocksize); if there
+        # are none, return the term at start alone. The term-local
+        # operations below consume their operands this way, so they never
+        # compute a term earlier than they would one term at a time (which
+        # recursive definitions like the exponential depend on), but take
+        # runs of terms that have already been computed in one call
+        return (self.__memo or self.__memoized()).run(start, size or self.blocksize)
+    
+    def _blocks(self, start=0):
+        # Generate the blocks returned by _block, from index start on
+        while True:
+            terms = self._block(start)
+            yield terms
+            start += len(terms)
+    
+    # Memo policies, and the window each sets on our memoized generator
+    memopolicies = dict(full=None, window=-1, none=0)
+    
+    def setmemo(self, policy='full', size=None):
+        """Set how many of the terms of this series are kept once computed.
+        
+        The ``full`` policy, the default, keeps them all. The ``window``
+        policy keeps only the last ``size`` of them (see the ``setwindow``
+        method of ``MemoizedGenerator``), and ``none`` keeps none; these
+        are for series whose terms are streamed once, by a single reader,
+        so that streaming a million terms doesn't keep them all in memory.
+        The reader is either a direct iteration over the series, or one
+        of the term-local operations (addition, multiplication by a number,
+        tail, integral and so on), which must be constructed before the
+        terms are streamed; the zeroth term, and the ``head`` of the series,
+        are computed here, so they stay available.
+        
+        >>> N = nseries()
+        >>> H = Fraction(1, 2) * N
+        >>> S = H.integral()
+        >>> for T in (N, H, S):
+        ...     T.setmemo('none')
+        >>> next(islice(S, 1000, None))
+        Fraction(999, 2000)
+        >>> [T.memory_usage()['count'] for T in (N, H, S)]
+        [0, 0, 0]
+        >>> S.memopolicy, S.stats()['terms']
+        ('none', 1001)
+        
+        >>> S.zero
+        Fraction(0, 1)
+        >>> S.head.showterms(2)
+        0
+        0
+        
+        Operations that need the whole history of their operands, such as
+        products, set the ``full`` policy on them when they are constructed,
+        and it can't be changed afterwards; so do the operations that read
+        a series that already has a reader, since the two can read it at
+        different offsets, and those that the generator of the series itself
+        constructs, as in a recursive definition. So the policy of a series
+        that may be read more than once can't be changed, and a series whose
+        terms have already been discarded can't be read by new operations:
+        
+        >>> S.tail
+        Traceback (most recent call last):
+        ...
+        ValueError: Memoized generator has already discarded terms.
+        >>> E = expseries()
+        >>> P = E * E
+        >>> E.setmemo('window', 10)
+        Traceback (most recent call last):
+        ...
+        ValueError: Memoized generator must keep all its terms.
+        >>> N = nseries()
+        >>> D = N - N
+        >>> N.setmemo('none')
+        Traceback (most recent call last):
+        ...
+        ValueError: Memoized generator must keep all its terms.
+        >>> expseries().setmemo('none')
+        Traceback (most recent call last):
+        ...
+        ValueError: Memoized generator must keep all its terms.
+        
+        A series given a window before a second reader is constructed is
+        pinned to the ``full`` policy then, so the readers still agree:
+        
+        >>> N = nseries()
+        >>> N.setmemo('none')
+        >>> A = N + N.xmul
+        >>> N.memopolicy
+        'full'
+        >>> A.showterms(4)
+        0
+        1
+        3
+        5
+        """
+        window = self.memopolicies[policy]
+        if window and (window < 0):
+            if not size or (size < 0):
+                raise ValueError("Window memo policy needs a positive size.")
+            window = size
+        if window is not None:
+            self.zero, self.head
+        self._memo.setwindow(window)
+    
+    @property
+    def memopolicy(self):
+        """The name of the memo policy of this series; see ``setmemo``.
+        """
+        window = self._memo.window
+        if window is None:
+            return 'full'
+        return 'window' if window else 'none'
+    
+    def _keepall(self):
+        # Pin our memo policy to full, for operations that need our whole history
+        self._memo.setwindow(None, pin=True)
+    
+    def _read(self):
+        # Register a term-local operation that reads our terms, when it is
+        # constructed; a second reader, or one constructed by our own
+        # generator, pins our memo policy to full (see setmemo)
+        self.__readers += 1
+        memo = self._memo
+        if memo.discarded:
+            raise ValueError("Memoized generator has already discarded terms.")
+        if (self.__readers > 1) or memo.running:
+            self._keepall()
+    
+    def stats(self):
+        """Return a dict of instrumentation counters for this series.
+        
+        The ``terms``, ``hits``, ``misses`` and ``time`` keys are those of
+        our memoized generator (see ``MemoizedGenerator.stats``); the
+        ``add``, ``mul``, ``compose``, ``integral`` and ``shift`` keys count
+        the results of those operations on this series that were returned
+        from its caches.
+        
+        >>> MemoizedGenerator.instrumented = True
+        >>> N = nseries()
+        >>> I = N.integral()
+        >>> N.integral() is I
+        True
+        >>> I.block(0, 3) == I.block(0, 3)
+        True
+        >>> s = I.stats()
+        >>> s['terms'], s['hits'], s['misses'], N.stats()['integral']
+        (3, 3, 3, 1)
+        >>> MemoizedGenerator.instrumented = False
+        """
+        result = self._memo.stats()
+        result.update(self.__hits)
+        return result
+    
+    def bitsizes(self, num=None, check=True):
+        """Return the bit sizes of the first ``num`` terms of this series.
+        
+        The result is a list of tuples giving the bit lengths of the numerator
+        and denominator of each term (see the ``bits`` function in ``bitsize.py``);
+        ``num`` defaults to ``self.testlimit``. If ``check`` is true, the sizes are
+        also checked with the ``checkgrowth`` function, which issues a
+        ``BitGrowthWarning`` if they grow abnormally fast.
+        
+        >>> [n + d for n, d in expseries().bitsizes()]
+        [2, 2, 3, 4, 6, 8, 11, 14, 17, 20]
+        
+        The square root of a series whose first term is not the square of a rational
+        is the classic case of abnormal growth:
+        
+        >>> warnings.simplefilter('ignore', BitGrowthWarning)
+        >>> S = sqrt(Fraction(2, 1) * nthpower(0) + nthpower(1))
+        >>> warnings.simplefilter('error', BitGrowthWarning)
+        >>> S.bitsizes()
+        Traceback (most recent call last):
+        ...
+        BitGrowthWarning: s: bit sizes grow by 208.5 bits per term
+        >>> warnings.resetwarnings()
+        """
+        sizes = [bits(term) for term in islice(self, num or self.testlimit)]
+        if check:
+            checkgrowth(sizes, self.name)
+        return sizes
+    
+    def release(self):
+        """Free the terms and cached results of this series, and the series itself.
+        
+        A series whose generator refers to the series itself, such as the
+        result of ``exponential`` or ``reciprocal``, or of a catalogue
+        function like ``expseries``, is part of a reference cycle, and so
+        are the series it caches the results of operations in, and their
+        memoized generators; such series are only freed by the cyclic
+        garbage collector, and not at all while the instance cache of the
+        ``PowerSeries`` class holds them. This method breaks the cycles,
+        and removes the series from the instance cache and from the caches
+        of other series, so that it is freed as soon as the last reference
+        to it goes away, even with the collector disabled.
+        
+        The results of operations cached in this series, and in turn the
+        results cached in them, are released too, since they can't compute
+        any more terms without it; so are the results of operations of other
+        series with this one that they cache, such as sums, products and
+        compositions. A released series has no terms; iterating over it
+        raises ``ValueError``. Series can also be released by using them as
+        context managers, or in groups with ``SeriesArena``.
+        
+        >>> import gc, weakref
+        >>> gc.disable()
+        >>> with expseries() as E:
+        ...     R = E.reciprocal()
+        ...     R.showterms(3)
+        1
+        -1
+        1/2
+        >>> refs = [weakref.ref(E), weakref.ref(R)]
+        >>> del E, R
+        >>> [r() for r in refs]
+        [None, None]
+        >>> gc.enable()
+        >>> S = nthpower(1)
+        >>> S.release()
+        >>> S.showterms(1)
+        Traceback (most recent call last):
+        ...
+        ValueError: PowerSeries has been released.
+        >>> T = tanseries()
+        >>> C = expseries()(T)
+        >>> C.showterms(3)
+        1
+        1
+        1/2
+        >>> T.release()
+        >>> C.showterms(6)
+        Traceback (most recent call last):
+        ...
+        ValueError: PowerSeries has been released.
+        """
+        _release([self])
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.release()
+    
+    def _free(self):
+        # Drop everything this series holds, including its generator
+        memo = self.__dict__.pop('_gen', None)
+        if memo is not None:
+            memo.im_func.clear()
+        for name in ('zero', 'head', 'tail', 'xmul', 'linear'):
+            self.__dict__.pop(name, None)
+        self.__g = _released
+        self.__D = self.__E = self.__R = self.__I = self.__S = self.__L = self.__F = None
+        for cache in (self.__As, self.__Ms, self.__Cs, self.__Is, self.__Ts, self.__Fs):
+            cache.clear()
+        self.__memo = None
+    
+    def _derived(self):
+        # Return the series cached in this one
+        result = [self.__dict__.get(name) for name in ('head', 'tail', 'xmul')]
+        result.extend((self.__D, self.__E, self.__R, self.__I, self.__S, self.__L, self.__F))
+        for cache in (self.__As, self.__Ms, self.__Cs, self.__Is, self.__Ts, self.__Fs):
+            result.extend(cache.itervalues())
+        return [S for S in result if S is not None]
+    
+    def _dependents(self, dead):
+        # Return the series cached in this one under the ids of the series
+        # whose ids are in dead, that is, the results of operations with them
+        return [S for cache in (self.__As, self.__Ms, self.__Cs)
+                for key, S in cache.iteritems() if key in dead]
+    
+    def _drop(self, dead):
+        # Drop the references this series holds, in its caches, to the
+        # series whose ids are in dead
+        for cache in (self.__As, self.__Ms, self.__Cs, self.__Is, self.__Ts, self.__Fs):
+            for key, S in cache.items():
+                if id(S) in dead:
+                    del cache[key]
+        self.__D, self.__E, self.__R, self.__I, self.__S, self.__L, self.__F = [
+            None if id(S) in dead else S
+            for S in (self.__D, self.__E, self.__R, self.__I, self.__S, self.__L, self.__F)]
+        for name in ('head', 'tail', 'xmul'):
+            if id(self.__dict__.get(name)) in dead:
+                del self.__dict__[name]
+    
+    def memory_usage(self, seen=None):
+        """Return a dict of the number of bytes held by this series' caches.
+        
+        The keys are ``terms`` (our memoized terms, including the
+        ``Fraction`` objects and their numerators and denominators),
+        ``properties`` (the memoized terms of our ``head``, ``tail`` and
+        ``xmul`` series, if they have been computed), ``opcache`` (our
+        operation caches, counting only the containers and their keys,
+        since the series they hold have caches of their own), and
+        ``total``. The ``count`` key gives the number of memoized terms,
+        and ``opentries`` the number of operation cache entries.
+        
+        No object is counted twice; for example, a series and its tail
+        share all but one of their terms, so ``properties`` will count
+        only one term of the tail. If ``seen`` is given, it must be a set
+        of object ids; objects whose ids are in it are not counted, and
+        the ids of the objects counted are added to it, so the same set
+        can be passed for several series to avoid counting shared terms
+        more than once.
+        
+        >>> E = expseries()
+        >>> E == altexpseries()
+        True
+        >>> u = E.memory_usage()
+        >>> u['count'], u['properties'], u['opentries']
+        (10, 0, 1)
+        
+        (The operation cache entry is the integral that the exponential series is
+        defined by.) The tail of the series shares its terms with the series itself,
+        so they are counted only once:
+        
+        >>> E.tail == altexpseries().tail
+        True
+        >>> v = E.memory_usage()
+        >>> v['count'], v['terms'] > u['terms'], v['properties']
+        (11, True, 0)
+        """
+        if seen is None:
+            seen = set()
+        terms = properties = nterms = 0
+        if '_gen' in self.__dict__:
+            cached = self._memo.cached()
+            nterms = len(cached)
+            terms = sys.getsizeof(cached) + sum(_sizeof(t, seen) for t in cached)
+        for name in ('head', 'tail', 'xmul'):
+            S = self.__dict__.get(name)
+            if (S is not None) and ('_gen' in S.__dict__):
+                properties += sum(_sizeof(t, seen) for t in S._memo.cached())
+        caches = (self.__As, self.__Ms, self.__Cs, self.__Is, self.__Ts, self.__Fs)
+        opcache = sum(sys.getsizeof(c) + sum(_sizeof(k, seen) for k in c) for c in caches)
+        opentries = sum(len(c) for c in caches) + sum(
+            S is not None for S in (self.__D, self.__E, self.__R, self.__I, self.__S, self.__L, self.__F))
+        return dict(terms=terms, properties=properties, opcache=opcache,
+                    total=(terms + properties + opcache),
+                    count=nterms, opentries=opentries)
+    
     def __eq__(self, other):
         """Test PowerSeries for equality.
         
@@ -266,6 +868,39 @@ class PowerSeries(object):
         for term in islice(self, num or self.testlimit):
             print term
     
+    def iterchunks(self, chunk=100, start=0, cancelled=None):
+        """Return an iterator over the terms from index ``start`` on, in lists of ``chunk`` terms.
+        
+        This is for callers, such as event loops, that cannot afford to block
+        while a long run of expensive terms is computed: each chunk is only
+        computed when it is asked for, so the caller can hand control back
+        between chunks. The terms come from the same memoized generator as
+        ordinary iteration, so terms computed by either are not computed again
+        by the other. For the same reason, the chunks must be taken in the
+        thread that uses the series (and every series it is built from), since
+        memoized generators are not thread-safe (see ``MemoizedGenerator``).
+        
+        If ``cancelled`` is given, it is called with no arguments before each
+        chunk, and the iterator stops if it returns true (a ``threading.Event``'s
+        ``is_set`` method works, so another thread can cancel the iteration);
+        an iterator that is simply abandoned, or closed, also stops computing
+        terms.
+        
+        >>> chunks = expseries().iterchunks(4)
+        >>> next(chunks)
+        [Fraction(1, 1), Fraction(1, 1), Fraction(1, 2), Fraction(1, 6)]
+        >>> next(chunks)[0]
+        Fraction(1, 24)
+        >>> flags = []
+        >>> for part in sinseries().iterchunks(3, cancelled=lambda: flags):
+        ...     flags.append(part)
+        >>> flags
+        [[Fraction(0, 1), Fraction(1, 1), Fraction(0, 1)]]
+        """
+        terms = islice(self, start, None)
+        while not (cancelled and cancelled()):
+            yield list(islice(terms, chunk))
+    
     @cached_property
     def zero(self):
         """Return the zeroth term of this series.
@@ -283,7 +918,10 @@ class PowerSeries(object):
         """
         def _h():
             yield self.zero
-        return PowerSeries(_h)
+        H = PowerSeries(_h)
+        H.step = 0
+        H.linear = ('head', self)
+        return H
     
     @cached_property
     def tail(self):
@@ -295,10 +933,20 @@ class PowerSeries(object):
         term, then dividing by x: tail(S) = 1/x (S - S(0)). See the
         docstring for the ``xmul`` method.
         """
+        self._read()
         def _t():
-            for term in islice(self, 1, None):
-                yield term
-        return PowerSeries(_t)
+            for terms in self._blocks(1):
+                for term in terms:
+                    yield term
+        T = PowerSeries(_t)
+        if self.valuation:
+            T.valuation, T.step = self.valuation - 1, self.step
+        elif self.step:
+            T.valuation, T.step = self.step - 1, self.step
+        else:
+            T.step = 0
+        T.linear = ('tail', self)
+        return T
     
     @cached_property
     def xmul(self):
@@ -320,11 +968,16 @@ class PowerSeries(object):
         >>> e == e.head + e.tail.xmul
         True
         """
+        self._read()
         def _x():
             yield Fraction(0, 1)
-            for term in self:
-                yield term
-        return PowerSeries(_x)
+            for terms in self._blocks():
+                for term in terms:
+                    yield term
+        X = PowerSeries(_x)
+        X.valuation, X.step = self.valuation + 1, self.step
+        X.linear = ('xmul', self)
+        return X
     
     def __add__(self, other):
         """Return a PowerSeries instance that sums self and other.
@@ -348,11 +1001,22 @@ class PowerSeries(object):
         if isinstance(other, PowerSeries):
             oid = oid or id(other)
             if oid in self.__As:
+                self.__hits['add'] += 1
                 return self.__As[oid]
+            self._read()
+            other._read()
             def _a():
-                for terms in izip_longest(self, other, fillvalue=Fraction(0, 1)):
-                    yield sum(terms)
+                n = 0
+                while True:
+                    a = self._block(n)
+                    b = other._block(n, len(a))
+                    for s, t in izip(a, b):
+                        yield s + t
+                    n += len(b)
             A = self.__As[oid] = PowerSeries(_a)
+            A.linear = ('add', self, other)
+            A.valuation = min(self.valuation, other.valuation)
+            A.step = gcd(gcd(self.step, other.step), abs(self.valuation - other.valuation))
             return A
         return NotImplemented
     
@@ -398,6 +1062,23 @@ class PowerSeries(object):
         will yield all zero elements. This includes the product of a zero
         fraction with ``self``; since we know the terms will all be zero,
         we avoid realizing our own generator.
+        
+        If the ``valuation`` and ``step`` fields of the factors show that
+        some of their terms are zero, the nth term of the product is computed
+        directly, as the sum of the products a(i) b(n - i) for the i and n - i
+        that are not known to be zero; so a product with x^50 takes one
+        multiplication per term, instead of the 50 levels of products of
+        tails that the general method takes, and a product of odd or even
+        series skips every other term:
+        
+        >>> P = nthpower(50) * expseries()
+        >>> P.valuation, P.block(50, 3)
+        (50, [Fraction(1, 1), Fraction(1, 1), Fraction(1, 2)])
+        >>> S = sinseries() * cosseries()
+        >>> S.valuation, S.step
+        (1, 2)
+        >>> S == Fraction(1, 2) * sinseries(fast=True).compose(Fraction(2, 1) * nthpower(1))
+        True
         """
         if isinstance(other, Fraction):
             if other == 1:
@@ -405,33 +1086,66 @@ class PowerSeries(object):
             if other == 0:
                 return PowerSeries()
             if other in self.__Ms:
+                self.__hits['mul'] += 1
                 return self.__Ms[other]
+            self._read()
             def _m():
-                for term in self:
-                    yield other * term
+                for terms in self._blocks():
+                    for term in terms:
+                        yield other * term
             oid = other
         elif isinstance(other, PowerSeries):
             oid = id(other)
             if oid in self.__Ms:
+                self.__hits['mul'] += 1
                 return self.__Ms[oid]
+            self._keepall()
+            other._keepall()
+            valuation = self.valuation + other.valuation
+            step = gcd(self.step, other.step)
+            if valuation or (step != 1):
+                M = self.__Ms[oid] = PowerSeries(self._sparseproduct(other))
+                M.valuation, M.step = valuation, step
+                return M
             def _m():
+                # With F and G the tails, the product is f0 g0 + x (f0 G + g0 F) + x^2 F G;
+                # the sum is fused into a single loop over F G and the factors
                 f0 = self.zero
                 g0 = other.zero
-                yield f0 * g0
-                F = self.tail
-                G = other.tail
-                mterms = [(F * G).xmul]
-                if f0 != 0:
-                    mterms.append(f0 * G)
-                if g0 != 0:
-                    mterms.append(g0 * F)
-                for terms in izip(*mterms):
-                    yield sum(terms)
+                comps = [(Fraction(1, 1), (), self.tail * other.tail, -2, 2, None),
+                         (f0, (), other, 0, 0, None), (g0, (), self, 0, 1, None)]
+                for term in _fusedgenerator({}, comps)():
+                    yield term
         else:
             return NotImplemented
         M = self.__Ms[oid] = PowerSeries(_m)
+        if isinstance(other, Fraction):
+            M.linear = ('scale', self, other)
+            M.valuation, M.step = self.valuation, self.step
         return M
     
+    def _sparseproduct(self, other):
+        # Return a generator for the product of self and other by direct
+        # convolution, skipping the terms known to be zero; the terms of
+        # each factor are only taken up to the index that the general
+        # method would need, so the product can still appear in its
+        # factors' definitions
+        v1, s1, v2, s2 = self.valuation, self.step, other.valuation, other.step
+        g = gcd(s1, s2)
+        def _p():
+            for n in count():
+                m = n - v1 - v2
+                if (m < 0) or (m % g if g else m):
+                    yield Fraction(0, 1)
+                    continue
+                a = self.block(0, n - v2 + 1)
+                b = other.block(0, n - v1 + 1)
+                indexes = xrange(v1, n - v2 + 1, s1) if s1 else (v1,)
+                yield sum((a[i] * b[n - i] for i in indexes
+                           if ((n - i - v2) % s2 == 0 if s2 else n - i == v2)),
+                          Fraction(0, 1))
+        return _p
+    
     __rmul__ = __mul__
     
     def __neg__(self):
@@ -483,9 +1197,27 @@ class PowerSeries(object):
         >>> X = nthpower(1)
         >>> X(X) == X
         True
+        
+        The known zero terms of the result follow from those of both series;
+        an even series with a zero constant term has its first nonzero term
+        at a multiple of its step:
+        
+        >>> C = sinseries()(cosseries() - nthpower(0))
+        >>> C.valuation, C.step
+        (2, 2)
+        >>> C.showterms(5)
+        0
+        0
+        -1/2
+        0
+        1/24
+        >>> D = PowerSeries(l=list(islice(C, 20)))
+        >>> C * X == D * X, C * C == D * D
+        (True, True)
         """
         oid = id(other)
         if oid in self.__Cs:
+            self.__hits['compose'] += 1
             return self.__Cs[oid]
         if isinstance(other, PowerSeries):
             if other.zero != 0:
@@ -495,6 +1227,11 @@ class PowerSeries(object):
                 for term in (other.tail * self.tail(other)):
                     yield term
             C = self.__Cs[oid] = PowerSeries(_c)
+            # The first term of other that can be nonzero; since its constant
+            # term is zero, that is a multiple of its step if its valuation is 0
+            v = other.valuation or other.step
+            if v:
+                C.valuation, C.step = self.valuation * v, gcd(self.step * v, other.step)
             return C
         raise TypeError("Can only compose a PowerSeries with another one.")
     
@@ -513,10 +1250,20 @@ class PowerSeries(object):
         """
         if self.__D:
             return self.__D
+        self._read()
         def _d():
-            for n, term in enumerate(self.tail):
-                yield Fraction(n + 1, 1) * term
+            n = 1
+            for terms in self._blocks(1):
+                for term in terms:
+                    yield n * term
+                    n += 1
         D = self.__D = PowerSeries(_d)
+        if self.valuation:
+            D.valuation, D.step = self.valuation - 1, self.step
+        elif self.step:
+            D.valuation, D.step = self.step - 1, self.step
+        else:
+            D.step = 0
         return D
     
     def integral(self, const=Fraction(0, 1)):
@@ -534,16 +1281,225 @@ class PowerSeries(object):
         True
         >>> cos == cos.integral().derivative()
         True
+        
+        Series with integer terms integrate to fractions too:
+        
+        >>> PowerSeries(l=[1, 1, 1, 1]).integral().showterms(5)
+        0
+        1
+        1/2
+        1/3
+        1/4
         """
         if const in self.__Is:
+            self.__hits['integral'] += 1
             return self.__Is[const]
+        self._read()
         def _i():
             yield const
-            for n, term in enumerate(self):
-                yield Fraction(1, n + 1) * term
+            n = 1
+            for terms in self._blocks():
+                for term in terms:
+                    yield Fraction(1, n) * term
+                    n += 1
         I = self.__Is[const] = PowerSeries(_i)
+        I.linear = ('integral', self, const)
+        if const:
+            I.step = gcd(self.step, self.valuation + 1)
+        else:
+            I.valuation, I.step = self.valuation + 1, self.step
         return I
     
+    def fused(self):
+        """Return a PowerSeries with the same terms as this one, computed in a single loop.
+        
+        The head, tail, xmul, addition, multiplication by a constant and
+        integral operations are linear, and each term of their results only
+        depends on a term or two of their operands; a chain of them costs a
+        generator for each operation, and a generator resume for each term
+        of each. This method expands the chain that this series is built by,
+        back to the series built some other way (for example by products, or
+        by catalogue functions), which we call bases, and compiles a single
+        generator that computes each term directly from the terms of the
+        bases. If this series is not the result of a linear operation, it
+        is returned unchanged.
+        
+        >>> ONE, X = nthpower(0), nthpower(1)
+        >>> S = ((Fraction(2, 1) * expseries()).tail.xmul + ONE - X).integral(Fraction(1, 1))
+        >>> S.fused() == S
+        True
+        >>> F = (ONE + tanseries() * tanseries()).integral()
+        >>> F.fused() == tanseries()
+        True
+        >>> expseries().head.fused() == ONE
+        True
+        >>> S = PowerSeries(l=[1, 2, 3]).integral(1).integral()
+        >>> S.fused() == S
+        True
+        
+        The bases are read by both this series and its fused version, so
+        they keep all their terms (see ``setmemo``):
+        
+        >>> N = nseries()
+        >>> N.setmemo('none')
+        >>> I = (Fraction(1, 2) * N).integral()
+        >>> F = I.fused()
+        >>> F.block(0, 4) == I.block(0, 4), N.memopolicy
+        (True, 'full')
+        """
+        if self.linear is None:
+            return self
+        if self.__F is None:
+            consts, comps = _linearform(self)
+            # Each component reads its base; a base that is read by other
+            # components, or by the chain of operations itself, keeps all
+            # its terms
+            for comp in comps:
+                comp[2]._read()
+            def _f():
+                for term in _fusedgenerator(consts, comps)():
+                    yield term
+            self.__F = PowerSeries(_f)
+            self.__F.valuation, self.__F.step = self.valuation, self.step
+        return self.__F
+    
+    @property
+    def parity(self):
+        """0 if this series is known to be even, 1 if known to be odd, otherwise None.
+        
+        The parity follows from the ``valuation`` and ``step`` fields, which
+        the catalogue functions set for odd and even functions and the
+        operations carry through:
+        
+        >>> sinseries().parity, cosseries().parity, expseries().parity
+        (1, 0, None)
+        >>> (sinseries() * tanseries()).parity, (sinseries() + cosseries()).parity
+        (0, None)
+        >>> cosseries().reciprocal().parity, sinseries().inverse().parity
+        (0, 1)
+        """
+        if self.step % 2 == 0:
+            return self.valuation % 2
+        return None
+    
+    def squeeze(self, step):
+        """Return the PowerSeries h such that this one is h(x^step).
+        
+        Every term whose index is not a multiple of ``step`` must be known
+        to be zero (see the ``valuation`` and ``step`` fields), so an even
+        series can be squeezed by 2; an odd series S can't, but its tail,
+        S / x, can. The inverse operation is ``spread``:
+        
+        >>> C = cosseries()
+        >>> C.squeeze(2).showterms(4)
+        1
+        -1/2
+        1/24
+        -1/720
+        >>> C.squeeze(2).spread(2) == C
+        True
+        """
+        if (self.valuation % step) or (self.step % step):
+            raise ValueError("PowerSeries has terms at indexes not divisible by %d." % step)
+        self._read()
+        def _q():
+            for term in islice(self, 0, None, step):
+                yield term
+        Q = PowerSeries(_q)
+        Q.valuation, Q.step = self.valuation // step, self.step // step
+        return Q
+    
+    def spread(self, step):
+        """Return a PowerSeries representing this one composed with x^step.
+        """
+        self._read()
+        def _s():
+            zeros = (Fraction(0, 1),) * (step - 1)
+            it = iter(self)
+            yield next(it)
+            for term in it:
+                for zero in zeros:
+                    yield zero
+                yield term
+        S = PowerSeries(_s)
+        S.valuation, S.step = self.valuation * step, self.step * step
+        return S
+    
+    def _symmetry(self):
+        # Return the largest d such that this series is known to be a
+        # series in x^d, or 1 if there is none; operations whose results
+        # are series in x^d as well (reciprocal, square root, exponential,
+        # logarithm) then compute them on the squeezed series, which has
+        # only 1/d as many terms to compute
+        d = gcd(self.valuation, self.step)
+        return d if d > 1 else 1
+    
+    def shift_center(self, a, order):
+        """Return a PowerSeries for the expansion of this one about x = a.
+        
+        The nth term of the result is the nth derivative at a divided by n!;
+        it is computed from the first ``order`` terms of this series, so the
+        result is exact if this series is a polynomial of degree less than
+        ``order``, and has ``order`` terms. Writing the terms as c(n) and the
+        shifted terms as b(k), the Taylor shift is the convolution
+        
+            b(k) k! = sum over n >= k of (c(n) n!) (a^(n - k) / (n - k)!)
+        
+        so the powers of a and the factorials are computed once, instead of
+        a binomial coefficient for each pair of terms. The truncation error
+        in b(k) is of the order of binomial(order, k) (a / R)^(order - k),
+        where R is the radius of convergence of this series, so only the
+        terms well below ``order`` (1 - a / R) are accurate; ``order`` should
+        be several times the number of shifted terms that will be used, and
+        more so the closer a is to the circle of convergence. The ``center`` field
+        of the result is the center of this series plus ``a``; results are
+        cached, like other operations, by ``a`` and ``order``.
+        
+        >>> P = nthpower(2).shift_center(Fraction(1, 1), 5)
+        >>> P == PowerSeries(l=[Fraction(1, 1), Fraction(2, 1), Fraction(1, 1)])
+        True
+        >>> P.center
+        Fraction(1, 1)
+        
+        Since a must be inside the circle of convergence of this series, and
+        the circle of convergence of the result is centered at a, shifting
+        a shifted series continues the function analytically past the circle
+        of convergence of the original series; for example, the series for
+        arctan, whose radius of convergence is 1, can be expanded about 1,
+        where its value is pi / 4:
+        
+        >>> from math import pi
+        >>> A = arctanseries(fast=True).shift_center(Fraction(1, 2), 200)
+        >>> A = A.shift_center(Fraction(1, 2), 40)
+        >>> A.center
+        Fraction(1, 1)
+        >>> abs(float(A.zero) - pi / 4) < 1e-12
+        True
+        """
+        a = Fraction(a)
+        key = (a, order)
+        if key in self.__Ts:
+            self.__hits['shift'] += 1
+            return self.__Ts[key]
+        self._keepall()
+        def _shift():
+            # c(n) n! and a^j / j!, for n and j less than order
+            c, p, f = [], [], 1
+            for n, term in enumerate(islice(self, order)):
+                if n:
+                    f *= n
+                c.append(term * f)
+                p.append(p[-1] * a / n if n else Fraction(1, 1))
+            f = 1
+            for k in xrange(len(c)):
+                if k:
+                    f *= k
+                yield sum((c[k + j] * p[j] for j in xrange(len(c) - k) if c[k + j]),
+                          Fraction(0, 1)) / f
+        T = self.__Ts[key] = PowerSeries(_shift)
+        T.center = self.center + a
+        return T
+    
     def exponential(self):
         """Return a PowerSeries representing e ** self.
         
@@ -574,6 +1530,10 @@ class PowerSeries(object):
             return self.__E
         if self.zero != 0:
             raise ValueError("First term of exponentiated PowerSeries must be 0.")
+        d = self._symmetry()
+        if d > 1:
+            E = self.__E = self.squeeze(d).exponential().spread(d)
+            return E
         def _e():
             for term in (E * self.derivative()).integral(Fraction(1, 1)):
                 yield term
@@ -605,6 +1565,10 @@ class PowerSeries(object):
             return self.__R
         if self.zero == 0:
             raise ValueError("Cannot take reciprocal of PowerSeries with first term 0.")
+        d = self._symmetry()
+        if d > 1:
+            R = self.__R = self.squeeze(d).reciprocal().spread(d)
+            return R
         def _r():
             recip = Fraction(1, 1) / self.zero
             yield recip
@@ -647,6 +1611,9 @@ class PowerSeries(object):
             for term in ((- recip) * ((T * T) * F.tail(I))):
                 yield term
         I = self.__I = PowerSeries(_i)
+        if self.valuation == 1:
+            # The inverse of an odd series is odd, and so on
+            I.valuation, I.step = 1, self.step
         return I
     
     def squareroot(self):
@@ -660,14 +1627,33 @@ class PowerSeries(object):
         
         Note that we can't take the square root of a series with a zero first term by
         this method, because we need to take a reciprocal.
+        
+        Note also that if the first term is not the square of a rational number, the
+        first term of the square root can only be a floating point approximation; the
+        result is then not exactly the square root, and the bit sizes of its terms grow
+        very quickly (see the ``bitsizes`` method), so we issue a ``BitGrowthWarning``:
+        
+        >>> warnings.simplefilter('error', BitGrowthWarning)
+        >>> sqrt(Fraction(3, 1) * nthpower(0))
+        Traceback (most recent call last):
+        ...
+        BitGrowthWarning: Square root of PowerSeries seeded with inexact value for sqrt(3).
+        >>> warnings.resetwarnings()
         """
         if self.__S:
             return self.__S
         if self.zero == 0:
             raise ValueError("Cannot take square root of PowerSeries with zero first term.")
+        d = self._symmetry()
+        if d > 1:
+            S = self.__S = self.squeeze(d).squareroot().spread(d)
+            return S
         from math import sqrt as _sqrt
+        s0 = Fraction.from_float(_sqrt(self.zero))
+        if s0 * s0 != self.zero:
+            warnings.warn("Square root of PowerSeries seeded with inexact value for sqrt(%s)."
+                          % self.zero, BitGrowthWarning, stacklevel=2)
         def _s():
-            s0 = Fraction.from_float(_sqrt(self.zero))
             yield s0
             for term in (self.tail * (s0 + S).reciprocal()):
                 yield term
@@ -704,11 +1690,231 @@ class PowerSeries(object):
             return self.__L
         if self.zero != 0:
             raise ValueError("Cannot take logarithm of PowerSeries with nonzero first term.")
+        d = self._symmetry()
+        if d > 1:
+            L = self.__L = self.squeeze(d).logarithm().spread(d)
+            return L
         def _l():
             for term in (self.derivative() / (Fraction(1, 1) + self)).integral():
                 yield term
         L = self.__L = PowerSeries(_l)
         return L
+    
+    # Elementary functions of a series; as with the exponential, the first
+    # term of the series must be zero. Each function F satisfies a first
+    # order differential equation F(S)' = G(S) S', so the terms of F(S)
+    # can be computed by integration at O(n) operations per term, instead
+    # of by composing the catalogue series with S. The results are cached
+    # by function name
+    
+    def __elementary(self, name):
+        # Return the cached result for the named function, or None after
+        # checking that it can be computed
+        F = self.__Fs.get(name)
+        if (F is None) and (self.zero != 0):
+            raise ValueError("Cannot take %s of PowerSeries with nonzero first term." % name)
+        return F
+    
+    def __tag(self, F, parity):
+        # Set the known zero terms of F, an odd (parity 1) or even (parity 0)
+        # function of this series: only powers S^k with k of that parity
+        # appear, and the indexes of their terms differ by multiples of
+        # the step of S and of twice its valuation
+        F.valuation = self.valuation if parity else 0
+        F.step = gcd(self.step, 2 * self.valuation)
+        return F
+    
+    def __sincos(self, sign, names):
+        # The sine and cosine (sign -1) or hyperbolic sine and cosine (sign 1),
+        # computed together: from S' = C U' and C' = sign S U', with d(k) = k u(k),
+        # n s(n) is the sum over k of d(k) c(n - k), and likewise for c(n)
+        s, c, d = [Fraction(0, 1)], [Fraction(1, 1)], [None]
+        D = self.derivative()
+        D._read()
+        D = iter(D)
+        def _advance(n):
+            while len(s) <= n:
+                m = len(s)
+                d.append(next(D))
+                ssum = csum = Fraction(0, 1)
+                for k in xrange(1, m + 1):
+                    dk = d[k]
+                    if dk:
+                        ssum += dk * c[m - k]
+                        csum += dk * s[m - k]
+                s.append(ssum / m)
+                c.append(sign * csum / m)
+        def _s():
+            for n in count():
+                _advance(n)
+                yield s[n]
+        def _c():
+            for n in count():
+                _advance(n)
+                yield c[n]
+        S, C = self.__tag(PowerSeries(_s), 1), self.__tag(PowerSeries(_c), 0)
+        S.name, C.name = names
+        self.__Fs[names[0]], self.__Fs[names[1]] = S, C
+    
+    def sin(self):
+        """Return a PowerSeries representing sin(self).
+        
+        The sine and cosine are computed together, in one pass over the
+        terms (see ``cos``). The results agree with composition, and with
+        the catalogue series:
+        
+        >>> X = nthpower(1)
+        >>> U = X + X * X
+        >>> U.sin() == sinseries()(U)
+        True
+        >>> X.sin() == sinseries()
+        True
+        >>> U.sin() * U.sin() + U.cos() * U.cos() == nthpower(0)
+        True
+        
+        Odd and even functions of odd series are tagged as such:
+        
+        >>> X.sin().parity, X.cos().parity, U.sin().parity
+        (1, 0, None)
+        """
+        F = self.__elementary('sin')
+        if F is None:
+            self.__sincos(-1, ('sin', 'cos'))
+            F = self.__Fs['sin']
+        return F
+    
+    def cos(self):
+        """Return a PowerSeries representing cos(self).
+        
+        >>> U = nthpower(1) - nthpower(3)
+        >>> U.cos() == cosseries()(U)
+        True
+        """
+        F = self.__elementary('cos')
+        if F is None:
+            self.__sincos(-1, ('sin', 'cos'))
+            F = self.__Fs['cos']
+        return F
+    
+    def sinh(self):
+        """Return a PowerSeries representing sinh(self).
+        
+        >>> U = nthpower(1) + nthpower(2)
+        >>> U.sinh() == sinhseries()(U)
+        True
+        >>> U.cosh() * U.cosh() - U.sinh() * U.sinh() == nthpower(0)
+        True
+        """
+        F = self.__elementary('sinh')
+        if F is None:
+            self.__sincos(1, ('sinh', 'cosh'))
+            F = self.__Fs['sinh']
+        return F
+    
+    def cosh(self):
+        """Return a PowerSeries representing cosh(self).
+        """
+        F = self.__elementary('cosh')
+        if F is None:
+            self.__sincos(1, ('sinh', 'cosh'))
+            F = self.__Fs['cosh']
+        return F
+    
+    def tan(self):
+        """Return a PowerSeries representing tan(self).
+        
+        Uses T' = (1 + T^2) U', like ``tanseries`` does for U = x:
+        
+        >>> U = nthpower(1) + nthpower(2)
+        >>> U.tan() == tanseries()(U)
+        True
+        >>> U.tan() == U.sin() / U.cos()
+        True
+        """
+        F = self.__elementary('tan')
+        if F is None:
+            def _tan():
+                for term in ((Fraction(1, 1) + F * F) * self.derivative()).integral():
+                    yield term
+            F = self.__Fs['tan'] = self.__tag(PowerSeries(_tan), 1)
+        return F
+    
+    def tanh(self):
+        """Return a PowerSeries representing tanh(self).
+        
+        >>> U = nthpower(1) + nthpower(2)
+        >>> U.tanh() == tanhseries()(U)
+        True
+        """
+        F = self.__elementary('tanh')
+        if F is None:
+            def _tanh():
+                for term in ((Fraction(1, 1) - F * F) * self.derivative()).integral():
+                    yield term
+            F = self.__Fs['tanh'] = self.__tag(PowerSeries(_tanh), 1)
+        return F
+    
+    def arctan(self):
+        """Return a PowerSeries representing arctan(self).
+        
+        >>> U = nthpower(1) + nthpower(2)
+        >>> U.arctan() == arctanseries()(U)
+        True
+        >>> U.tan().arctan() == U
+        True
+        """
+        F = self.__elementary('arctan')
+        if F is None:
+            F = self.__Fs['arctan'] = self.__tag(
+                (self.derivative() / (Fraction(1, 1) + self * self)).integral(), 1)
+        return F
+    
+    def arctanh(self):
+        """Return a PowerSeries representing arctanh(self).
+        
+        >>> U = nthpower(1) + nthpower(2)
+        >>> U.arctanh() == arctanhseries()(U)
+        True
+        """
+        F = self.__elementary('arctanh')
+        if F is None:
+            F = self.__Fs['arctanh'] = self.__tag(
+                (self.derivative() / (Fraction(1, 1) - self * self)).integral(), 1)
+        return F
+    
+    def arcsin(self):
+        """Return a PowerSeries representing arcsin(self).
+        
+        >>> U = nthpower(1) + nthpower(2)
+        >>> U.arcsin() == arcsinseries()(U)
+        True
+        >>> U.sin().arcsin() == U
+        True
+        """
+        F = self.__elementary('arcsin')
+        if F is None:
+            F = self.__Fs['arcsin'] = self.__tag(
+                (self.derivative() / (Fraction(1, 1) - self * self).squareroot()).integral(), 1)
+        return F
+    
+    def arcsinh(self):
+        """Return a PowerSeries representing arcsinh(self).
+        
+        >>> U = nthpower(1) + nthpower(2)
+        >>> U.arcsinh() == arcsinhseries()(U)
+        True
+        """
+        F = self.__elementary('arcsinh')
+        if F is None:
+            F = self.__Fs['arcsinh'] = self.__tag(
+                (self.derivative() / (Fraction(1, 1) + self * self).squareroot()).integral(), 1)
+        return F
+
+
+# The code of the generator of every series, to find the frames in which
+# series are computing terms; see _arena above
+
+_gencode = PowerSeries.__bases__[0].__dict__['_gen']._func.func_code
 
 
 def nthpower(n, coeff=Fraction(1, 1)):
@@ -729,7 +1935,79 @@ def nthpower(n, coeff=Fraction(1, 1)):
         for i in xrange(n):
             yield Fraction(0, 1)
         yield coeff
-    return PowerSeries(_n)
+    N = PowerSeries(_n)
+    N.linear = ('monomial', n, coeff)
+    N.valuation, N.step = n, 0
+    return N
+
+
+def hypergeometric(a, b, z=Fraction(1, 1), power=1, shift=0):
+    """The generalized hypergeometric series pFq as a PowerSeries.
+    
+    The series is x**shift * pFq(a; b; z * x**power), where ``a`` and ``b``
+    are sequences of the p upper and q lower parameters. Its nonzero terms
+    are t(n) = (a1)_n ... (ap)_n / ((b1)_n ... (bq)_n) * z**n / n!, where
+    (c)_n is the rising factorial c (c + 1) ... (c + n - 1), at the indexes
+    shift + n * power. Since the ratio t(n + 1) / t(n) is the rational function
+    (a1 + n) ... (ap + n) / ((b1 + n) ... (bq + n)) * z / (n + 1), each term
+    is computed from the previous one with a constant number of operations,
+    instead of the O(n) or worse cost of building the series from integrals,
+    reciprocals or inverses of other series.
+    
+    Many of the example series below are hypergeometric; for instance, the
+    simplest cases are the exponential series, 0F0(;;x), and the geometric
+    series 1 / (1 - x), which is 1F0(1;;x):
+    
+    >>> hypergeometric([], []) == expseries()
+    True
+    >>> hypergeometric([Fraction(1, 1)], []) == constseries(Fraction(1, 1))
+    True
+    
+    If one of the upper parameters is zero or a negative integer, the series
+    terminates:
+    
+    >>> hypergeometric([Fraction(-2, 1)], [], Fraction(-1, 1)).showterms(4)
+    1
+    2
+    1
+    0
+    
+    The parameters are stored on the series as a tuple ``(a, b, z, power, shift)``
+    in its ``hyperparams`` field, so that code evaluating the series can take
+    advantage of the term ratio.
+    
+    The ``power`` must be at least 1:
+    
+    >>> hypergeometric([], [], power=0)
+    Traceback (most recent call last):
+    ...
+    ValueError: Power of hypergeometric argument must be at least 1.
+    """
+    if power < 1:
+        raise ValueError("Power of hypergeometric argument must be at least 1.")
+    a = tuple(Fraction(c) for c in a)
+    b = tuple(Fraction(c) for c in b)
+    if any((c <= 0) and (c.denominator == 1) for c in b):
+        raise ValueError("Lower hypergeometric parameters cannot be zero or negative integers.")
+    z = Fraction(z)
+    def _hyp():
+        for i in xrange(shift):
+            yield Fraction(0, 1)
+        t = Fraction(1, 1)
+        for n in count():
+            yield t
+            if t == 0:
+                break
+            for i in xrange(power - 1):
+                yield Fraction(0, 1)
+            for c in a:
+                t *= c + n
+            for c in b:
+                t /= c + n
+            t *= z / (n + 1)
+    S = PowerSeries(_hyp)
+    S.hyperparams = (a, b, z, power, shift)
+    return S
 
 
 # Some convenience functions for PowerSeries
@@ -770,6 +2048,36 @@ def sqrt(S):
     return _sqrt(S)
 
 
+def _elementary(name, mathname):
+    # Make a convenience function for the PowerSeries method ``name``
+    # that falls back to the ``math`` module function ``mathname``
+    import math
+    mathfunc = getattr(math, mathname)
+    def f(S):
+        if isinstance(S, PowerSeries):
+            return getattr(S, name)()
+        return mathfunc(S)
+    f.__name__ = name
+    f.__doc__ = """Convenience function for taking %s of PowerSeries.
+    
+    This can also replace the ``math.%s`` function, extending it to
+    take a PowerSeries as an argument.
+    """ % (name, mathname)
+    return f
+
+
+sin = _elementary('sin', 'sin')
+cos = _elementary('cos', 'cos')
+tan = _elementary('tan', 'tan')
+arcsin = _elementary('arcsin', 'asin')
+arctan = _elementary('arctan', 'atan')
+sinh = _elementary('sinh', 'sinh')
+cosh = _elementary('cosh', 'cosh')
+tanh = _elementary('tanh', 'tanh')
+arcsinh = _elementary('arcsinh', 'asinh')
+arctanh = _elementary('arctanh', 'atanh')
+
+
 def inv(S):
     """Convenience function for inverting PowerSeries.
     """
@@ -794,8 +2102,222 @@ def integ(S, const=Fraction(0, 1)):
     raise TypeError("Cannot integrate object of type %s." % type(S))
 
 
+def statsreport(num=None):
+    """Print the instrumentation counters of all live series, costliest first.
+    
+    Series are sorted by the ``time`` counter (see the ``stats`` method),
+    which is the time spent in each series' own generator,
+    then by the number of terms computed; if ``num`` is given, only that
+    many series are printed. Each line gives the time, the number of terms,
+    memo hits and misses, operation cache hits, and the series name and id.
+    Series whose generators have never been realized are left out.
+    
+    This is the easiest way to find which intermediate series in a web of
+    generators is doing the work when a computation is slow; for example,
+    the products that the tangent series is built from, which are realized
+    inside its generator, show up near the top here even though we never
+    constructed them explicitly:
+    
+    >>> MemoizedGenerator.instrumented = True
+    >>> TAN = tanseries()
+    >>> TAN == alttanseries()
+    True
+    >>> statsreport(3) # doctest: +ELLIPSIS
+      0...  m 0x...
+    >>> MemoizedGenerator.instrumented = False
+    """
+    entries = []
+    for S in _registry.values():
+        if '_gen' in S.__dict__:
+            s = S.stats()
+            entries.append(((s['time'], s['misses'], s['terms']), S, s))
+    entries.sort(key=lambda e: e[0], reverse=True)
+    for key, S, s in islice(entries, num):
+        ophits = s['add'] + s['mul'] + s['compose'] + s['integral']
+        print "%10.6f %6d %8d %6d %5d  %s 0x%x" % (
+            s['time'], s['terms'], s['hits'], s['misses'], ophits,
+            S.name, id(S))
+
+
+def memory_summary():
+    """Return a dict summarizing the memory held by all live series.
+    
+    The ``terms``, ``properties``, ``opcache``, ``count`` and ``opentries``
+    keys are the totals of the corresponding keys returned by the
+    ``memory_usage`` method over all live series, with no object counted
+    twice. The ``series`` key gives the number of live series, and
+    ``realized`` the number whose generators have been realized. The
+    ``cache`` key gives the bytes held by the instance cache of the
+    ``PowerSeries`` class itself (the dict and its keys, which include
+    the generators of the series), and ``cached`` the number of series
+    in it; since that cache holds a reference to every series that was
+    constructed with hashable arguments, those series stay alive until
+    they are removed from it. Finally, ``total`` is the grand total of
+    bytes.
+    
+    Comparing summaries taken at different times shows whether memory
+    growth is in the number of live series, the number of terms or the
+    size of each term (``terms`` divided by ``count``), or in operation
+    cache entries:
+    
+    >>> before = memory_summary()
+    >>> TAN = tanseries()
+    >>> TAN == alttanseries()
+    True
+    >>> after = memory_summary()
+    >>> after['series'] > before['series'], after['count'] > before['count']
+    (True, True)
+    """
+    seen = set()
+    result = dict.fromkeys(('terms', 'properties', 'opcache', 'count', 'opentries',
+                            'series', 'realized'), 0)
+    for S in _registry.values():
+        result['series'] += 1
+        result['realized'] += '_gen' in S.__dict__
+        for key, value in S.memory_usage(seen).iteritems():
+            if key != 'total':
+                result[key] += value
+    cache = PowerSeries._instance_cache
+    result['cached'] = len(cache)
+    result['cache'] = sys.getsizeof(cache) + sum(
+        sys.getsizeof(key) + sum(sys.getsizeof(k) for k in key[1:]) for key in cache)
+    result['total'] = result['terms'] + result['properties'] + result['opcache'] + result['cache']
+    return result
+
+
+def _release(series, owned=None):
+    # Release the given series, and the series derived from them, whether
+    # cached in them or in other series (see the ``release`` method of
+    # ``PowerSeries``); if owned is given, only the series whose ids are
+    # in it are released, and the rest are left intact
+    series, released, dead = list(series), [], set()
+    while series:
+        for S in series:
+            if (id(S) not in dead) and ((owned is None) or (id(S) in owned)):
+                dead.add(id(S))
+                released.append(S)
+                series.extend(S._derived())
+        series = [D for S in _registry.values() if id(S) not in dead
+                  for D in S._dependents(dead) if id(D) not in dead]
+    for S in released:
+        S._free()
+    for S in _registry.values():
+        if id(S) not in dead:
+            S._drop(dead)
+    cache = PowerSeries._instance_cache
+    for key, S in cache.items():
+        if id(S) in dead:
+            del cache[key]
+
+
+class SeriesArena(object):
+    """Context manager that releases every series constructed inside it.
+    
+    Every ``PowerSeries`` constructed while the arena is active, whether
+    directly or by operations, is released when the ``with`` block exits
+    (see the ``release`` method of ``PowerSeries``), so a batch of work
+    that builds many recursively defined series frees them all at once,
+    without waiting for the cyclic garbage collector. Series constructed
+    before the arena was entered are not released, even if they are used
+    inside it, but their caches no longer refer to any of the released
+    series. A series that another series constructs while computing
+    its terms belongs with that series, so the series that series
+    constructed before the arena are defined in terms of are not
+    released either, even if their terms are first computed inside
+    it. Arenas can be nested; every other series belongs to the
+    innermost arena active when it is constructed.
+    
+    >>> import gc
+    >>> gc.disable()
+    >>> X = nthpower(1)
+    >>> before = len(_registry)
+    >>> with SeriesArena() as arena:
+    ...     T = X.tan()
+    ...     t = list(islice(T, 20))
+    ...     S = Fraction(2, 1) * X
+    ...     total, inside = len(_registry) - before, len(arena.series)
+    >>> total > 5, inside == total
+    (True, True)
+    >>> del T, S
+    >>> len(_registry) == before
+    True
+    >>> X.tan() is not None, X.tan().block(3, 1)
+    (True, [Fraction(1, 3)])
+    >>> gc.enable()
+    >>> T, E = tanseries(), expseries()
+    >>> with SeriesArena():
+    ...     t = list(islice(T, 4))
+    ...     R = E.reciprocal()
+    ...     r = list(islice(R, 4))
+    >>> T.block(0, 8) == list(islice(alttanseries(), 8))
+    True
+    >>> E.block(0, 8) == list(islice(altexpseries(), 8))
+    True
+    """
+    
+    def __init__(self):
+        self.series = WeakValueDictionary()
+    
+    def __enter__(self):
+        _arenas.append(self)
+        return self
+    
+    def __exit__(self, *exc_info):
+        _arenas.remove(self)
+        series = dict(self.series)
+        _release(series.values(), series)
+
+
 # Example series
 
+# Coefficient bounds for the example series; each takes the absolute value
+# of an argument x and returns (M, r) with r > x such that every term a(n)
+# of the series satisfies |a(n)| r^n <= M, or None if it has no such bound
+# for x, and is stored in the ``cauchybound`` field of the series (see the
+# ``enclose`` method of ``PowerFunction`` in ``powerfunc.py``)
+
+def _entirebound(x):
+    # Terms at most 1 / n! in magnitude, so |a(n)| r^n <= e^r < 3^r; an
+    # integer r of at least 2x makes x / r at most 1/2
+    r = 2 * (x.numerator // x.denominator + 1)
+    return (Fraction(3 ** r, 1), Fraction(r, 1))
+
+
+def _unitbound(x):
+    # Terms at most 1 in magnitude, radius of convergence 1
+    if x < 1:
+        return (Fraction(1, 1), Fraction(1, 1))
+    return None
+
+
+def _halfpibound(x):
+    # Radius of convergence pi/2; with r = 3/2 the largest |a(n)| r^n for
+    # the tangent, secant and their hyperbolic versions is 3/2 (at n = 1),
+    # and the ratio of r to the radius is less than 1, so M = 2 is safe
+    if x < Fraction(3, 2):
+        return (Fraction(2, 1), Fraction(3, 2))
+    return None
+
+
+def _catalogue(bound, funcname=None, parity=None):
+    # Decorator for the example series functions, storing bound in the
+    # cauchybound field of the series they return, the name of the
+    # function in the funcname field for those functions that have
+    # argument reduction strategies (see ``powerfunc.py``), and, for
+    # odd and even functions, their known zero terms (parity 1 and 0)
+    def decorator(f):
+        @wraps(f)
+        def _f(*args, **kwds):
+            S = f(*args, **kwds)
+            S.cauchybound = bound
+            S.funcname = funcname
+            if parity is not None:
+                S.valuation, S.step = parity, 2
+            return S
+        return _f
+    return decorator
+
+
 def constseries(const):
     """An infinite sequence of constant values as a PowerSeries.
     
@@ -830,7 +2352,7 @@ def nseries():
     return PowerSeries(f=lambda n: Fraction(n, 1))
 
 
-def harmonicseries():
+def harmonicseries(fast=False):
     """The harmonic series 1/n as a PowerSeries.
     
     The harmonic series is the series representation of - ln(1 - x).
@@ -854,11 +2376,21 @@ def harmonicseries():
     
     >>> integ(constseries(Fraction(1, 1))) == harmonicseries()
     True
+    
+    If ``fast`` is true, the series is instead the hypergeometric series
+    x 2F1(1,1;2;x) (see ``hypergeometric``); its terms cost about the same,
+    but it can be summed by binary splitting (see the ``binarysplit``
+    method of ``PowerFunction``):
+    
+    >>> harmonicseries(fast=True) == harmonicseries()
+    True
     """
+    if fast:
+        return hypergeometric([Fraction(1, 1), Fraction(1, 1)], [Fraction(2, 1)], shift=1)
     return PowerSeries(f=lambda n: Fraction(1, n) if n else Fraction(0, 1))
 
 
-def altharmonicseries():
+def altharmonicseries(fast=False):
     """The alternating sign harmonic series as a PowerSeries.
     
     The alternating sign harmonic series is the series representation of
@@ -874,11 +2406,20 @@ def altharmonicseries():
     
     >>> integ(altconstseries(Fraction(1, 1))) == altharmonicseries()
     True
+    
+    If ``fast`` is true, the series is instead the hypergeometric series
+    x 2F1(1,1;2;-x), as for ``harmonicseries``:
+    
+    >>> altharmonicseries(fast=True) == altharmonicseries()
+    True
     """
+    if fast:
+        return hypergeometric([Fraction(1, 1), Fraction(1, 1)], [Fraction(2, 1)], Fraction(-1, 1), shift=1)
     return PowerSeries(f=lambda n: Fraction((-1, 1)[n % 2], n) if n else Fraction(0, 1))
 
 
-def expseries():
+@_catalogue(_entirebound, 'exp')
+def expseries(fast=False):
     """The exponential function as a PowerSeries.
     
     We want to avoid using factorials to compute series, since
@@ -907,7 +2448,15 @@ def expseries():
     True
     >>> integ(EXP, Fraction(1, 1)) == EXP
     True
+    
+    If ``fast`` is true, the series is instead the hypergeometric series
+    0F0(;;x) (see ``hypergeometric``):
+    
+    >>> expseries(fast=True) == expseries()
+    True
     """
+    if fast:
+        return hypergeometric([], [])
     def _exp():
         for term in integ(EXP, Fraction(1, 1)):
             yield term
@@ -915,7 +2464,8 @@ def expseries():
     return EXP
 
 
-def sinseries():
+@_catalogue(_entirebound, 'sin', 1)
+def sinseries(fast=False):
     """The sine function as a PowerSeries.
     
     See remarks above under ``expseries`` for why we don't use
@@ -933,7 +2483,15 @@ def sinseries():
     >>> SIN = sinseries()
     >>> deriv(deriv(SIN)) == - SIN
     True
+    
+    If ``fast`` is true, the series is instead the hypergeometric series
+    x 0F1(;3/2;-x^2/4) (see ``hypergeometric``):
+    
+    >>> sinseries(fast=True) == sinseries()
+    True
     """
+    if fast:
+        return hypergeometric([], [Fraction(3, 2)], Fraction(-1, 4), power=2, shift=1)
     def _sin():
         for term in integ(integ(-SIN, Fraction(1, 1))):
             yield term
@@ -941,7 +2499,8 @@ def sinseries():
     return SIN
 
 
-def cosseries():
+@_catalogue(_entirebound, 'cos', 0)
+def cosseries(fast=False):
     """The cosine function as a PowerSeries.
     
     See remarks above under ``expseries`` for why we don't use
@@ -964,7 +2523,15 @@ def cosseries():
     True
     >>> deriv(COS) == - SIN
     True
+    
+    If ``fast`` is true, the series is instead the hypergeometric series
+    0F1(;1/2;-x^2/4) (see ``hypergeometric``):
+    
+    >>> cosseries(fast=True) == cosseries()
+    True
     """
+    if fast:
+        return hypergeometric([], [Fraction(1, 2)], Fraction(-1, 4), power=2)
     def _cos():
         for term in integ(integ(-COS), Fraction(1, 1)):
             yield term
@@ -972,6 +2539,7 @@ def cosseries():
     return COS
 
 
+@_catalogue(_halfpibound, 'tan', 1)
 def tanseries():
     """The tangent function as a PowerSeries.
     
@@ -999,12 +2567,13 @@ def tanseries():
     """
     def _tan():
         ONE = nthpower(0)
-        for term in integ(ONE + (TAN * TAN)):
+        for term in integ(ONE + (TAN * TAN)).fused():
             yield term
     TAN = PowerSeries(_tan)
     return TAN
 
 
+@_catalogue(_halfpibound, None, 0)
 def secseries():
     """The secant function as a PowerSeries.
     
@@ -1034,7 +2603,8 @@ def secseries():
     return SEC
 
 
-def arcsinseries():
+@_catalogue(_unitbound, None, 1)
+def arcsinseries(fast=False):
     """The arcsine function as a PowerSeries.
     
     >>> arcsinseries().showterms()
@@ -1066,7 +2636,15 @@ def arcsinseries():
     True
     >>> SIN(ARCSIN) == X
     True
+    
+    If ``fast`` is true, the series is instead the hypergeometric series
+    x 2F1(1/2,1/2;3/2;x^2) (see ``hypergeometric``):
+    
+    >>> arcsinseries(fast=True) == arcsinseries()
+    True
     """
+    if fast:
+        return hypergeometric([Fraction(1, 2), Fraction(1, 2)], [Fraction(3, 2)], power=2, shift=1)
     def _arcsin():
         ONE = nthpower(0)
         X2 = nthpower(2)
@@ -1075,7 +2653,8 @@ def arcsinseries():
     return PowerSeries(_arcsin)
 
 
-def arctanseries():
+@_catalogue(_unitbound, 'arctan', 1)
+def arctanseries(fast=False):
     """The arctangent function as a PowerSeries.
     
     >>> arctanseries().showterms()
@@ -1107,7 +2686,15 @@ def arctanseries():
     True
     >>> TAN(ARCTAN) == X
     True
+    
+    If ``fast`` is true, the series is instead the hypergeometric series
+    x 2F1(1/2,1;3/2;-x^2) (see ``hypergeometric``):
+    
+    >>> arctanseries(fast=True) == arctanseries()
+    True
     """
+    if fast:
+        return hypergeometric([Fraction(1, 2), Fraction(1, 1)], [Fraction(3, 2)], Fraction(-1, 1), power=2, shift=1)
     def _arctan():
         ONE = nthpower(0)
         X2 = nthpower(2)
@@ -1116,7 +2703,8 @@ def arctanseries():
     return PowerSeries(_arctan)
 
 
-def sinhseries():
+@_catalogue(_entirebound, None, 1)
+def sinhseries(fast=False):
     """The hyperbolic sine function as a PowerSeries.
     
     See remarks above under ``expseries`` for why we don't use
@@ -1134,7 +2722,15 @@ def sinhseries():
     >>> SINH = sinhseries()
     >>> deriv(deriv(SINH)) == SINH
     True
+    
+    If ``fast`` is true, the series is instead the hypergeometric series
+    x 0F1(;3/2;x^2/4) (see ``hypergeometric``):
+    
+    >>> sinhseries(fast=True) == sinhseries()
+    True
     """
+    if fast:
+        return hypergeometric([], [Fraction(3, 2)], Fraction(1, 4), power=2, shift=1)
     def _sinh():
         for term in integ(integ(SINH, Fraction(1, 1))):
             yield term
@@ -1142,7 +2738,8 @@ def sinhseries():
     return SINH
 
 
-def coshseries():
+@_catalogue(_entirebound, None, 0)
+def coshseries(fast=False):
     """The hyperbolic cosine function as a PowerSeries.
     
     See remarks above under ``expseries`` for why we don't use
@@ -1165,7 +2762,15 @@ def coshseries():
     True
     >>> deriv(COSH) == SINH
     True
+    
+    If ``fast`` is true, the series is instead the hypergeometric series
+    0F1(;1/2;x^2/4) (see ``hypergeometric``):
+    
+    >>> coshseries(fast=True) == coshseries()
+    True
     """
+    if fast:
+        return hypergeometric([], [Fraction(1, 2)], Fraction(1, 4), power=2)
     def _cosh():
         for term in integ(integ(COSH), Fraction(1, 1)):
             yield term
@@ -1173,6 +2778,7 @@ def coshseries():
     return COSH
 
 
+@_catalogue(_halfpibound, None, 1)
 def tanhseries():
     """The hyperbolic tangent function as a PowerSeries.
     
@@ -1203,6 +2809,7 @@ def tanhseries():
     return TANH
 
 
+@_catalogue(_halfpibound, None, 0)
 def sechseries():
     """The hyperbolic secant function as a PowerSeries.
     
@@ -1230,7 +2837,8 @@ def sechseries():
     return SECH
 
 
-def arcsinhseries():
+@_catalogue(_unitbound, None, 1)
+def arcsinhseries(fast=False):
     """The hyperbolic arcsine function as a PowerSeries.
     
     >>> arcsinhseries().showterms()
@@ -1261,7 +2869,15 @@ def arcsinhseries():
     True
     >>> SINH(ARCSINH) == X
     True
+    
+    If ``fast`` is true, the series is instead the hypergeometric series
+    x 2F1(1/2,1/2;3/2;-x^2) (see ``hypergeometric``):
+    
+    >>> arcsinhseries(fast=True) == arcsinhseries()
+    True
     """
+    if fast:
+        return hypergeometric([Fraction(1, 2), Fraction(1, 2)], [Fraction(3, 2)], Fraction(-1, 1), power=2, shift=1)
     def _arcsinh():
         ONE = nthpower(0)
         X2 = nthpower(2)
@@ -1270,7 +2886,8 @@ def arcsinhseries():
     return PowerSeries(_arcsinh)
 
 
-def arctanhseries():
+@_catalogue(_unitbound, None, 1)
+def arctanhseries(fast=False):
     """The hyperbolic arctangent function as a PowerSeries.
     
     >>> arctanhseries().showterms()
@@ -1301,7 +2918,15 @@ def arctanhseries():
     True
     >>> TANH(ARCTANH) == X
     True
+    
+    If ``fast`` is true, the series is instead the hypergeometric series
+    x 2F1(1/2,1;3/2;x^2) (see ``hypergeometric``):
+    
+    >>> arctanhseries(fast=True) == arctanhseries()
+    True
     """
+    if fast:
+        return hypergeometric([Fraction(1, 2), Fraction(1, 1)], [Fraction(3, 2)], power=2, shift=1)
     def _arctanh():
         ONE = nthpower(0)
         X2 = nthpower(2)
@@ -1495,6 +3120,12 @@ def altarctanhseries():
     return alttanhseries().inverse()
 
 
+# The cached_class decorator hides the methods of PowerSeries from doctest,
+# since they are defined on the class it wraps, so point doctest at that class
+
+__test__ = dict(PowerSeries=PowerSeries.__bases__[0])
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod()
@@ -0,0 +1,118 @@
+#! /usr/bin/env python
+"""
+Copyright (C) 2011 by Peter A. Donis.
+Released under the open source MIT license:
+http://www.opensource.org/licenses/MIT
+
+Power series of rational functions. The quotient P / Q of two
+polynomials can be computed as a ``PowerSeries`` with the general
+``reciprocal`` and multiplication operations, but that takes O(n)
+operations per term; multiplying through by Q instead shows that
+the terms satisfy a linear recurrence with constant coefficients,
+
+    q0 a(n) = p(n) - (q1 a(n - 1) + ... + qd a(n - d))
+
+where d is the degree of Q (and p(n) is zero past the degree of P),
+so each term takes a constant number of operations. The recurrence
+also means that a single term far out in the series can be computed
+without computing the ones before it, by reducing a power of x modulo
+the characteristic polynomial of the recurrence (Fiduccia's method),
+which takes O(d^2 log n) operations.
+
+The Fibonacci numbers are the terms of 1 / (1 - x - x^2):
+
+    >>> from powerseries import nthpower
+    >>> ONE = nthpower(0)
+    >>> X = nthpower(1)
+    >>> FIB = RationalSeries([1], [1, -1, -1])
+    >>> FIB == ONE / (ONE - X - X * X)
+    True
+    >>> FIB.showterms(8)
+    1
+    1
+    2
+    3
+    5
+    8
+    13
+    21
+    >>> FIB.coefficient(99)
+    Fraction(354224848179261915075, 1)
+    >>> FIB.coefficient(10 ** 6) % 10 ** 10
+    Fraction(4926937501, 1)
+"""
+
+from collections import deque
+from fractions import Fraction
+from itertools import count, islice
+
+from powerseries import PowerSeries
+from polynomial import pdivmod, pmul, pnorm
+
+
+class RationalSeries(PowerSeries):
+    """The power series of the rational function P / Q.
+
+    ``P`` and ``Q`` are sequences of the coefficients of the numerator
+    and denominator polynomials, lowest degree first, like the ``l``
+    argument of ``PowerSeries``; the constant term of ``Q`` must not
+    be zero.
+
+    >>> from powerseries import nthpower
+    >>> X = nthpower(1)
+    >>> S = RationalSeries([1, 2], [1, 0, -3, 1])
+    >>> S == (nthpower(0) + Fraction(2, 1) * X) / (nthpower(0) - Fraction(3, 1) * X * X + X * X * X)
+    True
+    >>> all(S.coefficient(n) == term for n, term in enumerate(islice(S, 20)))
+    True
+    """
+
+    def __new__(cls, P, Q):
+        P, Q = pnorm(P), pnorm(Q)
+        if not (Q and Q[0]):
+            raise ZeroDivisionError("Denominator must have nonzero constant term.")
+        d = len(Q) - 1
+        def _rat():
+            a = deque(maxlen=d) if d else ()
+            for n in count():
+                t = P[n] if n < len(P) else Fraction(0, 1)
+                for j in xrange(1, min(n, d) + 1):
+                    t -= Q[j] * a[-j]
+                t /= Q[0]
+                if d:
+                    a.append(t)
+                yield t
+        self = PowerSeries.__new__(cls, _rat)
+        self.P, self.Q = P, Q
+        return self
+
+    def coefficient(self, n):
+        """Return the term of index n, computed in O(log n) operations.
+
+        Past the numerator, the terms satisfy the recurrence for all n
+        from n0 on, so a(n0 + m) is the same linear function of the d
+        terms starting at n0 as x^m modulo the characteristic polynomial
+        is of the powers of x up to x^(d - 1).
+        """
+        P, Q = self.P, self.Q
+        d = len(Q) - 1
+        n0 = max(len(P), d)
+        if n < n0 + d:
+            return next(islice(self, n, None))
+        start = list(islice(self, n0, n0 + d))
+        # The characteristic polynomial, monic, lowest degree first
+        chi = tuple(Q[d - i] / Q[0] for i in xrange(d)) + (Fraction(1, 1),)
+        result, power, m = (Fraction(1, 1),), (Fraction(0, 1), Fraction(1, 1)), n - n0
+        power = pdivmod(power, chi)[1]
+        while m:
+            if m & 1:
+                result = pdivmod(pmul(result, power), chi)[1]
+            m >>= 1
+            if m:
+                power = pdivmod(pmul(power, power), chi)[1]
+        return sum((r * a for r, a in zip(result, start)), Fraction(0, 1))
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,378 @@
+#! /usr/bin/env python
+"""
+Copyright (C) 2011 by Peter A. Donis.
+Released under the open source MIT license:
+http://www.opensource.org/licenses/MIT
+
+A lazy expression layer over the ``PowerSeries`` class. Operations
+on a ``PowerSeries`` construct new generators right away, and the
+operation caches of each series are keyed on the identity of the
+other operand; so equal subexpressions that are built separately
+are computed separately, and identities that make an operation a
+no-op are never noticed. The ``Expr`` class in this module instead
+records each operation as a node in a directed acyclic graph, and
+only constructs the corresponding ``PowerSeries`` (by the ordinary
+operations) when its ``series`` property is first accessed.
+
+Expression nodes are "hash-consed": the class is decorated with
+``cached_class``, so structurally identical expressions are the
+same node, and are materialized as the same series. Commutative
+operations order their operands canonically, so the order in which
+they are written does not matter:
+
+    >>> from powerseries import nthpower, sinseries, cosseries
+    >>> SIN = expr(sinseries())
+    >>> COS = expr(cosseries())
+    >>> SIN * COS is COS * SIN
+    True
+    >>> (SIN * SIN).series is (SIN * SIN).series
+    True
+    >>> (SIN * SIN + COS * COS).series == nthpower(0)
+    True
+
+Before a node is constructed, a few cheap algebraic rewrites are
+applied, so that no generator is ever created for an operation
+that can be simplified away. Constants are written as fractions,
+or wrapped with the ``const`` function:
+
+    >>> X = expr(nthpower(1))
+    >>> X * const(1) is X
+    True
+    >>> X + const(0) is X
+    True
+    >>> inv(inv(SIN)) is SIN
+    True
+    >>> print exp(log(X))
+    add(n, 1)
+    >>> exp(log(X)).series == nthpower(0) + nthpower(1)
+    True
+    >>> print Fraction(2, 1) * (Fraction(3, 1) * SIN)
+    scale(6, sin)
+    >>> print SIN - Fraction(1, 2) * SIN
+    scale(1/2, sin)
+    >>> print deriv(integ(COS, Fraction(1, 1)))
+    cos
+
+The full list of rewrites is:
+
+    - Sums and products of constants are folded;
+    - Adding zero, and multiplying by one, are no-ops;
+    - Multiplying by a constant becomes a scaling, and nested
+      scalings are merged, as are sums of scalings of the same node;
+    - Scaling by zero or one, and multiplying a node by its own
+      reciprocal, give constants or the node itself;
+    - The reciprocal of a reciprocal, and the inverse of an
+      inverse, give back the original node;
+    - The exponential of a logarithm gives back one plus the
+      original node (since the logarithm of ``S`` is log(1 + S),
+      see the ``logarithm`` method of ``PowerSeries``), and the
+      logarithm of an exponential minus one gives back the node;
+    - The derivative of an integral gives back the integrand,
+      and derivatives are distributed over scalings.
+
+Iterating over a node iterates over its series, so nodes can be
+passed to anything that takes an iterable of terms, such as the
+``PowerFunction`` class.
+"""
+
+from fractions import Fraction
+from itertools import count
+
+from cached_class import cached_class
+from cached_property import cached_property
+import powerseries
+from powerseries import PowerSeries, nthpower
+
+
+# Serial numbers for expression nodes, used to order the
+# operands of commutative operations canonically
+
+_serials = count()
+
+
+@cached_class
+class Expr(object):
+    """A node in a lazy expression graph over power series.
+
+    Each node has an operation name ``op`` and a tuple of arguments
+    ``args``, which are other nodes or fractions. Nodes should not be
+    constructed directly; use the ``expr`` and ``const`` functions to
+    make leaf nodes, and the operators and methods of this class (or
+    the functions in this module) to combine them, so that the
+    rewrite rules are applied.
+    """
+
+    def __init__(self, op, *args):
+        self.op = op
+        self.args = args
+        self.serial = next(_serials)
+        # For leaf nodes, set by the expr function below
+        self.leaf = None
+
+    def __str__(self):
+        if self.op == 'series':
+            return self.leaf.name
+        if self.op == 'const':
+            return str(self.args[0])
+        return "%s(%s)" % (self.op, ", ".join(str(arg) for arg in self.args))
+
+    @cached_property
+    def series(self):
+        """The ``PowerSeries`` for this node, constructed on first access.
+        """
+        op, args = self.op, self.args
+        if op == 'series':
+            return self.leaf
+        if op == 'const':
+            if args[0] == 0:
+                return PowerSeries()
+            return nthpower(0, args[0])
+        if op == 'scale':
+            return args[0] * args[1].series
+        if op == 'integral':
+            return args[0].series.integral(args[1])
+        series = [arg.series for arg in args]
+        if op == 'add':
+            return series[0] + series[1]
+        if op == 'mul':
+            return series[0] * series[1]
+        if op == 'compose':
+            return series[0].compose(series[1])
+        return getattr(series[0], op)()
+
+    def __iter__(self):
+        return iter(self.series)
+
+    def __add__(self, other):
+        return _add(self, expr(other))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return _add(self, _scale(Fraction(-1, 1), expr(other)))
+
+    def __rsub__(self, other):
+        return _add(expr(other), _scale(Fraction(-1, 1), self))
+
+    def __mul__(self, other):
+        if isinstance(other, Fraction):
+            return _scale(other, self)
+        return _mul(self, expr(other))
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return _scale(Fraction(-1, 1), self)
+
+    def __div__(self, other):
+        if isinstance(other, Fraction):
+            return _scale(Fraction(1, 1) / other, self)
+        return _mul(self, expr(other).reciprocal())
+
+    def __rdiv__(self, other):
+        return _mul(expr(other), self.reciprocal())
+
+    def compose(self, other):
+        return _node('compose', self, expr(other))
+
+    def __call__(self, other):
+        return self.compose(other)
+
+    def derivative(self):
+        op, args = self.op, self.args
+        if op == 'integral':
+            return args[0]
+        if op == 'const':
+            return const(0)
+        if op == 'scale':
+            return _scale(args[0], args[1].derivative())
+        return _node('derivative', self)
+
+    def integral(self, const=Fraction(0, 1)):
+        return _node('integral', self, const)
+
+    def exponential(self):
+        if self.op == 'logarithm':
+            return _add(const(1), self.args[0])
+        if _isconst(self, 0):
+            return const(1)
+        return _node('exponential', self)
+
+    def logarithm(self):
+        if self.op == 'add':
+            for a, b in (self.args, reversed(self.args)):
+                if _isconst(a, -1) and (b.op == 'exponential'):
+                    return b.args[0]
+        if _isconst(self, 0):
+            return self
+        return _node('logarithm', self)
+
+    def reciprocal(self):
+        if self.op == 'reciprocal':
+            return self.args[0]
+        if self.op == 'const' and self.args[0] != 0:
+            return const(Fraction(1, 1) / self.args[0])
+        return _node('reciprocal', self)
+
+    def inverse(self):
+        if self.op == 'inverse':
+            return self.args[0]
+        return _node('inverse', self)
+
+    def squareroot(self):
+        return _node('squareroot', self)
+
+
+def _node(op, *args):
+    # The only place nodes are constructed
+    return Expr(op, *args)
+
+
+def _isconst(e, value=None):
+    # Test whether e is a constant node, with the given value if any
+    return (e.op == 'const') and ((value is None) or (e.args[0] == value))
+
+
+def _scaling(e):
+    # Return e as a tuple (c, base) such that e = c * base
+    if e.op == 'scale':
+        return e.args
+    return (Fraction(1, 1), e)
+
+
+def _add(a, b):
+    if _isconst(a) and _isconst(b):
+        return const(a.args[0] + b.args[0])
+    if _isconst(a, 0):
+        return b
+    if _isconst(b, 0):
+        return a
+    (c, base), (d, other) = _scaling(a), _scaling(b)
+    if base is other:
+        return _scale(c + d, base)
+    if a.serial > b.serial:
+        a, b = b, a
+    return _node('add', a, b)
+
+
+def _mul(a, b):
+    if _isconst(a) and _isconst(b):
+        return const(a.args[0] * b.args[0])
+    if _isconst(a):
+        return _scale(a.args[0], b)
+    if _isconst(b):
+        return _scale(b.args[0], a)
+    if (a.op == 'reciprocal' and a.args[0] is b) or (b.op == 'reciprocal' and b.args[0] is a):
+        return const(1)
+    if a.serial > b.serial:
+        a, b = b, a
+    return _node('mul', a, b)
+
+
+def _scale(c, e):
+    if c == 1:
+        return e
+    if c == 0:
+        return const(0)
+    if _isconst(e):
+        return const(c * e.args[0])
+    d, base = _scaling(e)
+    if d * c == 1:
+        return base
+    return _node('scale', d * c, base)
+
+
+def const(c):
+    """Return the expression node for the constant series ``c``.
+    """
+    return _node('const', Fraction(c))
+
+
+def expr(S):
+    """Return the expression node for ``S``.
+
+    ``S`` can be a ``PowerSeries``, which becomes a leaf node (the
+    same node each time for the same series), a number, which becomes
+    a constant node, or a node, which is returned unchanged. The empty
+    series is recognized as the constant zero, and the zeroth powers of
+    x made by ``nthpower`` as the constants they are, so the rewrites
+    apply to them:
+
+    >>> from powerseries import sinseries
+    >>> ONE = expr(nthpower(0))
+    >>> SIN = expr(sinseries())
+    >>> ONE is const(1), SIN * ONE is SIN
+    (True, True)
+    >>> expr(nthpower(0, Fraction(1, 2))) is const(Fraction(1, 2))
+    True
+    """
+    if isinstance(S, Expr):
+        return S
+    if isinstance(S, (Fraction, int, long)):
+        return const(S)
+    if isinstance(S, PowerSeries):
+        if S is PowerSeries():
+            return const(0)
+        if S.linear and (S.linear[0] == 'monomial') and (S.linear[1] == 0):
+            return const(S.linear[2])
+        e = _node('series', id(S))
+        # The node keeps S alive, so its id cannot be reused
+        e.leaf = S
+        return e
+    raise TypeError("Cannot make expression from object of type %s." % type(S))
+
+
+# Convenience functions for expressions, which also work on
+# PowerSeries and numbers like the ones in powerseries.py
+
+def exp(S):
+    """Convenience function for exponentiating expressions.
+    """
+    if isinstance(S, Expr):
+        return S.exponential()
+    return powerseries.exp(S)
+
+
+def log(S):
+    """Convenience function for taking logarithms of expressions.
+    """
+    if isinstance(S, Expr):
+        return S.logarithm()
+    return powerseries.log(S)
+
+
+def sqrt(S):
+    """Convenience function for taking square roots of expressions.
+    """
+    if isinstance(S, Expr):
+        return S.squareroot()
+    return powerseries.sqrt(S)
+
+
+def inv(S):
+    """Convenience function for inverting expressions.
+    """
+    if isinstance(S, Expr):
+        return S.inverse()
+    return powerseries.inv(S)
+
+
+def deriv(S):
+    """Convenience function for differentiating expressions.
+    """
+    if isinstance(S, Expr):
+        return S.derivative()
+    return powerseries.deriv(S)
+
+
+def integ(S, const=Fraction(0, 1)):
+    """Convenience function for integrating expressions.
+    """
+    if isinstance(S, Expr):
+        return S.integral(const)
+    return powerseries.integ(S, const)
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
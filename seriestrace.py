@@ -0,0 +1,204 @@
+#! /usr/bin/env python
+"""
+Copyright (C) 2011 by Peter A. Donis.
+Released under the open source MIT license:
+http://www.opensource.org/licenses/MIT
+
+Tracing of the dependency graph between power series. Every
+operation on a ``PowerSeries`` constructs a new series whose
+generator pulls terms from the generators of its operands, so
+even a simple expression builds a web of series that is hidden
+inside the generators. The ``SeriesTracer`` class in this module
+records that web as a graph whose nodes are series and whose
+edges mean "pulls terms from", together with the number of terms
+each series computes and the time spent computing them, both
+excluding ("self") and including the time spent in the series it
+pulls from. The graph can be exported in the Chrome trace event
+format (load it in chrome://tracing or any compatible viewer) or
+as Graphviz source.
+
+Typical usage:
+
+    >>> from powerseries import nthpower, exp, log
+    >>> X = nthpower(1)
+    >>> with SeriesTracer() as tracer:
+    ...     E = exp(log(X))
+    ...     E.showterms(5)
+    ...
+    1
+    1
+    0
+    0
+    0
+    >>> len(tracer.nodes) > 10
+    True
+    >>> print tracer.graphviz() # doctest: +ELLIPSIS
+    digraph series {
+    ...
+    }
+    >>> import json
+    >>> events = json.loads(tracer.chrometrace())['traceEvents']
+    >>> sorted(set(e['ph'] for e in events))
+    [u'X']
+
+Only series whose generators are realized while the tracer is
+active are traced; series realized before it was entered keep
+their untraced realizations. Note also that the tracer keeps a
+reference to every series it has seen, so drop the tracer when
+you are done with it to allow the series to be reclaimed.
+"""
+
+import json
+from timeit import default_timer
+
+from MemoizedGenerator import MemoizedGenerator
+
+
+class SeriesTracer(object):
+    """Record the graph of series pulling terms from each other.
+
+    Use an instance as a context manager; while the ``with`` block
+    is active, the ``instrumented`` and ``tracer`` class fields of
+    ``MemoizedGenerator`` are set so that every memoized generator
+    realized inside the block reports to this tracer. Their previous
+    values are restored when the block exits.
+
+    The ``nodes`` field maps the id of each traced series to a dict
+    with the keys ``name``, ``terms`` (the number of terms computed
+    while tracing), ``self`` and ``total`` (the time in seconds spent
+    computing those terms, excluding and including the time spent
+    in other series). The ``edges`` field maps pairs of ids
+    ``(puller, pulled)`` to the number of terms pulled along that
+    edge, whether computed or taken from the memo cache.
+
+    If ``events`` is true (the default), every term computation is
+    also recorded as a separate event for ``chrometrace``; set it to
+    false when tracing long computations to save memory.
+    """
+
+    def __init__(self, events=True):
+        self.nodes = {}
+        self.edges = {}
+        self.events = [] if events else None
+        self.__objects = {}
+        self.__stack = []
+        self.__start = default_timer()
+        self.__saved = None
+
+    def __enter__(self):
+        self.__saved = (MemoizedGenerator.instrumented, MemoizedGenerator.tracer)
+        MemoizedGenerator.instrumented = True
+        MemoizedGenerator.tracer = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        MemoizedGenerator.instrumented, MemoizedGenerator.tracer = self.__saved
+        return False
+
+    def _node(self, gen):
+        # Return the id and node for the memoized generator gen,
+        # creating the node if necessary
+        obj = gen.owner or gen
+        key = id(obj)
+        try:
+            return key, self.nodes[key]
+        except KeyError:
+            self.__objects[key] = obj
+            node = self.nodes[key] = dict(
+                name=getattr(obj, 'name', None) or type(obj).__name__,
+                terms=0, self=0.0, total=0.0)
+            return key, node
+
+    def _edge(self, key):
+        # Record an edge from the series on top of the stack to key
+        if self.__stack:
+            edge = (self.__stack[-1][0], key)
+            self.edges[edge] = self.edges.get(edge, 0) + 1
+
+    def hit(self, gen):
+        """Record a cached term of ``gen`` being pulled.
+        """
+        key, node = self._node(gen)
+        self._edge(key)
+
+    def push(self, gen):
+        """Record the start of a term computation in ``gen``.
+        """
+        key, node = self._node(gen)
+        self._edge(key)
+        # Each stack frame is [key, start time, time spent in children]
+        self.__stack.append([key, default_timer(), 0.0])
+
+    def pop(self, gen):
+        """Record the end of the term computation started by ``push``.
+        """
+        end = default_timer()
+        key, start, children = self.__stack.pop()
+        elapsed = end - start
+        node = self.nodes[key]
+        node['terms'] += 1
+        node['self'] += elapsed - children
+        node['total'] += elapsed
+        if self.__stack:
+            self.__stack[-1][2] += elapsed
+        if self.events is not None:
+            self.events.append((key, start, elapsed))
+
+    def report(self, num=None):
+        """Print the traced series, highest self time first.
+
+        Each line gives the self and total times, the number of terms
+        computed, the number of series pulled from, and the series name
+        and id; if ``num`` is given, only that many series are printed.
+        """
+        pulls = {}
+        for puller, pulled in self.edges:
+            pulls[puller] = pulls.get(puller, 0) + 1
+        keys = sorted(self.nodes, key=lambda k: self.nodes[k]['self'], reverse=True)
+        for key in keys[:num]:
+            node = self.nodes[key]
+            print "%10.6f %10.6f %6d %3d  %s 0x%x" % (
+                node['self'], node['total'], node['terms'], pulls.get(key, 0),
+                node['name'], key)
+
+    def chrometrace(self):
+        """Return the trace as a string in Chrome trace event JSON format.
+
+        Each term computation becomes a complete ("X") event named after
+        its series, so the viewer shows the nesting of computations in
+        time, and its per-name summary gives the self and total times.
+        The per-series totals are attached to each event as arguments.
+        Note that if the tracer was created with ``events`` false, there
+        are no events to export.
+        """
+        events = []
+        for key, start, elapsed in self.events or ():
+            node = self.nodes[key]
+            events.append(dict(
+                name="%s 0x%x" % (node['name'], key), cat="series", ph="X",
+                ts=(start - self.__start) * 1e6, dur=elapsed * 1e6,
+                pid=0, tid=0, args=dict(terms=node['terms'])))
+        return json.dumps(dict(traceEvents=events))
+
+    def graphviz(self):
+        """Return the graph as a string of Graphviz (dot) source.
+
+        Each node is labeled with the series name, the number of terms
+        computed, and the self and total times in milliseconds; each
+        edge points from a series to one it pulls terms from, and is
+        labeled with the number of terms pulled.
+        """
+        lines = ["digraph series {"]
+        for key, node in sorted(self.nodes.iteritems()):
+            lines.append('    s%x [label="%s\\nterms %d\\nself %.3f ms\\ntotal %.3f ms"];' % (
+                key, node['name'], node['terms'],
+                node['self'] * 1e3, node['total'] * 1e3))
+        for (puller, pulled), pulls in sorted(self.edges.iteritems()):
+            lines.append('    s%x -> s%x [label="%d"];' % (puller, pulled, pulls))
+        lines.append("}")
+        return "\n".join(lines)
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
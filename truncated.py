@@ -0,0 +1,273 @@
+#! /usr/bin/env python
+"""
+Copyright (C) 2011 by Peter A. Donis.
+Released under the open source MIT license:
+http://www.opensource.org/licenses/MIT
+
+Fixed-precision truncated power series. The ``PowerSeries`` class
+represents infinite series lazily, which means every operation
+allocates a new series and generator, and every term pulled goes
+through the memoization machinery of each intermediate series.
+When the number of terms needed is known up front, that is pure
+overhead; the ``TruncatedSeries`` class in this module instead
+keeps the first ``order`` terms in a preallocated list, and its
+operations work in place on that list, reusing a scratch buffer
+of the same size for the operations that need one, and never
+create generators or intermediate series.
+
+The in-place operations follow the conventions of the corresponding
+``PowerSeries`` methods; in particular ``exp_`` requires a zero first
+term, and ``log_`` replaces S by log(1 + S), which also requires a zero
+first term:
+
+    >>> from powerseries import nthpower, expseries, sinseries, log
+    >>> X = nthpower(1)
+    >>> T = TruncatedSeries.fromseries(X, 20)
+    >>> T.exp_()
+    >>> T.toseries() == expseries()
+    True
+    >>> T = TruncatedSeries.fromseries(sinseries(), 20)
+    >>> T *= T
+    >>> T.log_()
+    >>> T.toseries() == log(sinseries() * sinseries())
+    True
+    >>> E = TruncatedSeries.fromseries(expseries(), 20)
+    >>> E.compose_(TruncatedSeries.fromseries(sinseries(), 20))
+    >>> E.toseries() == expseries()(sinseries())
+    True
+    >>> E /= E
+    >>> E.toseries() == nthpower(0)
+    True
+
+Operations combine series of the same order; the result of converting
+back with ``toseries`` has all terms past the order equal to zero.
+Numbers, including integers, can appear on either side of a sum,
+difference or product:
+
+    >>> Fraction(2, 1) * T == T * Fraction(2, 1) == T + T == 2 * T
+    True
+    >>> Fraction(1, 1) + T == T + Fraction(1, 1) == 1 + T
+    True
+    >>> 1 - T == -(T - 1) == -T + 1
+    True
+    >>> (1 - T)[0] == 1 - T[0], (-T)[1] == -T[1]
+    (True, True)
+"""
+
+from fractions import Fraction
+from itertools import islice
+
+from powerseries import PowerSeries
+
+
+# The types of numbers that combine with a TruncatedSeries
+_numbers = (int, long, Fraction)
+
+
+def _mulinto(a, b, order):
+    # Multiply the list a in place by the list b, modulo x**order; terms are
+    # computed from the highest down, so each term of a is overwritten only
+    # after every product that uses it is done (which also makes a is b safe)
+    for n in xrange(order - 1, -1, -1):
+        a[n] = sum((a[k] * b[n - k] for k in xrange(n + 1) if a[k] and b[n - k]),
+                   Fraction(0, 1))
+
+
+class TruncatedSeries(object):
+    """The first ``order`` terms of a power series, in a preallocated list.
+
+    The ``terms`` argument gives the initial terms; missing terms are zero.
+    The terms are in the ``coeffs`` field, which should be treated as a
+    fixed length list.
+    """
+
+    def __init__(self, order, terms=()):
+        self.order = order
+        self.coeffs = [Fraction(0, 1)] * order
+        for n, term in enumerate(islice(terms, order)):
+            self.coeffs[n] = Fraction(term)
+        self.__scratch = [Fraction(0, 1)] * order
+
+    @classmethod
+    def fromseries(cls, S, order):
+        """Return a TruncatedSeries with the first ``order`` terms of ``S``.
+        """
+        return cls(order, iter(S))
+
+    def toseries(self):
+        """Return a PowerSeries with the terms of this one.
+        """
+        return PowerSeries(l=list(self.coeffs))
+
+    def copy(self):
+        return TruncatedSeries(self.order, iter(self.coeffs))
+
+    def __iter__(self):
+        return iter(self.coeffs)
+
+    def __getitem__(self, n):
+        return self.coeffs[n]
+
+    def __eq__(self, other):
+        if isinstance(other, TruncatedSeries):
+            return (self.order == other.order) and (self.coeffs == other.coeffs)
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def showterms(self, num=None):
+        """Print the first ``num`` terms, defaulting to all of them.
+        """
+        for term in islice(self.coeffs, num):
+            print term
+
+    def _check(self, other):
+        if other.order != self.order:
+            raise ValueError("TruncatedSeries orders must match.")
+
+    def __iadd__(self, other):
+        c = self.coeffs
+        if isinstance(other, _numbers):
+            c[0] += other
+        elif isinstance(other, TruncatedSeries):
+            self._check(other)
+            for n, term in enumerate(other.coeffs):
+                c[n] += term
+        else:
+            return NotImplemented
+        return self
+
+    def __isub__(self, other):
+        c = self.coeffs
+        if isinstance(other, _numbers):
+            c[0] -= other
+        elif isinstance(other, TruncatedSeries):
+            self._check(other)
+            for n, term in enumerate(other.coeffs):
+                c[n] -= term
+        else:
+            return NotImplemented
+        return self
+
+    def __imul__(self, other):
+        c = self.coeffs
+        if isinstance(other, _numbers):
+            for n, term in enumerate(c):
+                c[n] = other * term
+        elif isinstance(other, TruncatedSeries):
+            self._check(other)
+            _mulinto(c, other.coeffs, self.order)
+        else:
+            return NotImplemented
+        return self
+
+    def __idiv__(self, other):
+        """Divide in place, term by term from the lowest up.
+
+        Each quotient term overwrites the dividend term it was computed
+        from, and only needs the quotient terms below it.
+        """
+        c = self.coeffs
+        if isinstance(other, _numbers):
+            other = Fraction(other)
+            for n, term in enumerate(c):
+                c[n] = term / other
+            return self
+        if not isinstance(other, TruncatedSeries):
+            return NotImplemented
+        self._check(other)
+        b = other.coeffs
+        if b[0] == 0:
+            raise ValueError("Cannot divide by TruncatedSeries with first term 0.")
+        if other is self:
+            c[:] = [Fraction(1, 1)] + [Fraction(0, 1)] * (self.order - 1)
+            return self
+        for n in xrange(self.order):
+            c[n] = (c[n] - sum((b[k] * c[n - k] for k in xrange(1, n + 1) if b[k]),
+                               Fraction(0, 1))) / b[0]
+        return self
+
+    __itruediv__ = __idiv__
+
+    def __add__(self, other):
+        return self.copy().__iadd__(other)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self.copy().__isub__(other)
+
+    def __rsub__(self, other):
+        return (-self).__iadd__(other)
+
+    def __neg__(self):
+        return self.copy().__imul__(Fraction(-1, 1))
+
+    def __mul__(self, other):
+        return self.copy().__imul__(other)
+
+    __rmul__ = __mul__
+
+    def __div__(self, other):
+        return self.copy().__idiv__(other)
+
+    __truediv__ = __div__
+
+    def exp_(self):
+        """Replace this series by its exponential, in place.
+
+        From E' = S' E, n e(n) = sum over k from 1 to n of k s(k) e(n - k);
+        the k s(k) are kept in the scratch buffer, since the terms of S
+        are overwritten as we go.
+        """
+        c, d = self.coeffs, self.__scratch
+        if c[0] != 0:
+            raise ValueError("First term of exponentiated TruncatedSeries must be 0.")
+        for k in xrange(self.order):
+            d[k] = k * c[k]
+        if self.order:
+            c[0] = Fraction(1, 1)
+        for n in xrange(1, self.order):
+            c[n] = sum((d[k] * c[n - k] for k in xrange(1, n + 1) if d[k]),
+                       Fraction(0, 1)) / n
+
+    def log_(self):
+        """Replace this series S by log(1 + S), in place.
+
+        From (1 + S) L' = S', n l(n) = n s(n) - sum over k from 1 to n - 1
+        of k l(k) s(n - k); the terms of S are kept in the scratch buffer.
+        """
+        c, d = self.coeffs, self.__scratch
+        if c[0] != 0:
+            raise ValueError("Cannot take logarithm of TruncatedSeries with nonzero first term.")
+        d[:] = c
+        for n in xrange(1, self.order):
+            c[n] = d[n] - sum((k * c[k] * d[n - k] for k in xrange(1, n) if d[n - k]),
+                              Fraction(0, 1)) / n
+
+    def compose_(self, other):
+        """Replace this series S by S(other), in place.
+
+        Horner's rule, accumulating in the scratch buffer; the first term
+        of ``other`` must be zero, so each multiplication by it pushes the
+        terms already accumulated one place higher.
+        """
+        self._check(other)
+        c, d, b = self.coeffs, self.__scratch, other.coeffs
+        if b[0] != 0:
+            raise ValueError("First term of composed TruncatedSeries must be 0.")
+        for n in xrange(self.order):
+            d[n] = Fraction(0, 1)
+        for k in xrange(self.order - 1, -1, -1):
+            _mulinto(d, b, self.order)
+            d[0] += c[k]
+        c[:] = d
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()